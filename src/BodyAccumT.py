@@ -0,0 +1,114 @@
+## @file BodyAccumT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which accumulates the sums describing a body
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+## @brief Defines a body accumulator ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Keeps only the running sums needed to build a body, namely
+#           the total mass, the sums of m * x and m * y, and the sum of
+#           m * (x^2 + y^2), so its memory stays constant regardless of
+#           how many point masses are added. A point mass may carry its
+#           own moment of inertia about its position, which lets whole
+#           shapes be added through the parallel axis theorem
+
+
+class BodyAccumT:
+    ## @brief Constructor for BodyAccumT
+    #  @details The accumulator starts empty
+    def __init__(self):
+        self.n = 0
+        self.m = 0
+        self.mx = 0
+        self.my = 0
+        self.mr2 = 0
+
+    ## @brief Adds a single point mass to the accumulator
+    #  @param x A real number which is the x-component of the point mass
+    #  @param y A real number which is the y-component of the point mass
+    #  @param m A real number which is the mass of the point mass
+    #  @param inert A real number which is the moment of inertia of the
+    #               point mass about its own position
+    #  @throws ValueError if the mass is not greater than zero
+    def add(self, x, y, m, inert=0):
+        if not(m > 0):
+            raise ValueError
+
+        self.n += 1
+        self.m += m
+        self.mx += x * m
+        self.my += y * m
+        self.mr2 += m * (x**2 + y**2) + inert
+
+    ## @brief Removes a single point mass from the accumulator
+    #  @param x A real number which is the x-component of the point mass
+    #  @param y A real number which is the y-component of the point mass
+    #  @param m A real number which is the mass of the point mass
+    #  @param inert A real number which is the moment of inertia of the
+    #               point mass about its own position
+    #  @throws ValueError if the accumulator is empty
+    def remove(self, x, y, m, inert=0):
+        if self.n == 0:
+            raise ValueError
+
+        self.n -= 1
+        self.m -= m
+        self.mx -= x * m
+        self.my -= y * m
+        self.mr2 -= m * (x**2 + y**2) + inert
+
+    ## @brief Adds a chunk of point masses using vectorized reductions
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @throws ValueError if the chunks aren't the same length or if
+    #          any of the masses is not greater than zero
+    def add_chunk(self, x_s, y_s, m_s):
+        x = np.asarray(x_s, dtype=np.float64)
+        y = np.asarray(y_s, dtype=np.float64)
+        m = np.asarray(m_s, dtype=np.float64)
+        if not(x.shape == y.shape and y.shape == m.shape):
+            raise ValueError
+        if not np.all(m > 0):
+            raise ValueError
+
+        self.n += m.size
+        self.m += float(m.sum())
+        self.mx += float(np.dot(m, x))
+        self.my += float(np.dot(m, y))
+        self.mr2 += float(np.dot(m, x * x) + np.dot(m, y * y))
+
+    ## @brief Merges the sums of another accumulator into this one
+    #  @param other A BodyAccumT whose point masses are to be added
+    def merge(self, other):
+        self.n += other.n
+        self.m += other.m
+        self.mx += other.mx
+        self.my += other.my
+        self.mr2 += other.mr2
+
+    ## @brief Getter for the number of point masses added so far
+    #  @returns A natural number which is the number of point masses
+    def count(self):
+        return self.n
+
+    ## @brief Getter for the accumulated sums
+    #  @returns The total mass, sum of m * x, sum of m * y
+    #           and sum of m * (x^2 + y^2) of the point masses
+    #  @throws ValueError if no point masses have been added
+    def sums(self):
+        if self.n == 0:
+            raise ValueError
+
+        return self.m, self.mx, self.my, self.mr2
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another accumulator to test for equality
+    #  @returns A boolean, true iff both objects have the same state variables
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
@@ -3,43 +3,233 @@
 #  @brief Defines an ADT which specifies a body (a collection of point masses)
 #  @date Jan. 10, 2021
 
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
 from Shape import Shape
+from BodyAccumT import BodyAccumT
+from MomentAccumT import MomentAccumT
 
 ## @brief Defines a body ADT. Assumption: Assume all inputs
 #         provided to methods are of the correct type
 #  @details Extends the Shape interface. A body can be visualized
 #           as a set of point-masses in 2-d space.
+#           Instances have no __dict__ and take at most 64 bytes
+#           (as reported by sys.getsizeof) besides their field values.
+#           A body keeps only these values, not its point masses; the
+#           subclass LazyBodyT is the body which keeps them, and so can
+#           also be coarsened into levels of detail.
 
 
 class BodyT(Shape):
+    __slots__ = ('cmx', 'cmy', 'm', 'moment')
+
     ## @brief Constructor for BodyT
+    #  @details If any of x_s, y_s or m_s is a NumPy array the body is
+    #           built with vectorized reductions, otherwise the sequences
+    #           are summed exactly in a single pass
     #  @param x_s A sequence of real numbers which
     #             are the x-component of each point mass
     #  @param y_s A sequence of real numbers which
     #             are the y-component of each point mass
     #  @param m_s A sequence of real numbers which
     #             are the mass of each point mass
+    #  @param robust A boolean, true to accumulate the moment about the
+    #                center of mass with a MomentAccumT, which stays
+    #                accurate for points far from the origin
     #  @throws ValueError if the the moment of inertia or mass
     #          are invalid values, or if the sequences x_s, y_s,
     #           and m_s aren't the same length
-    def __init__(self, x_s, y_s, m_s):
+    def __init__(self, x_s, y_s, m_s, robust=False):
         if not(len(x_s) == len(y_s) and len(y_s) == len(m_s)):
             raise ValueError
 
-        for mass in m_s:
-            if not(mass > 0):
-                raise ValueError
+        if robust:
+            self.__set_moments__(*self.__robust_accum__(x_s, y_s, m_s).moments())
+            return
+        if any(isinstance(z, np.ndarray) for z in (x_s, y_s, m_s)):
+            sums = self.__array_sums__(x_s, y_s, m_s)
+        else:
+            sums = self.__seq_sums__(x_s, y_s, m_s)
 
-        cm_x = self.__cm__(x_s, m_s)
-        cm_y = self.__cm__(y_s, m_s)
-        m = sum(m_s)
+        self.__set_sums__(*sums)
 
-        self.cmx = cm_x
-        self.cmy = cm_y
-        self.m = m
+    ## @brief Constructs a body from NumPy arrays or any buffer
+    #  @details With more than one worker the arrays are split into shards
+    #           whose partial sums are reduced on a thread pool (NumPy
+    #           releases the GIL in its reductions) and then merged
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @param workers A natural number which is the number of threads
+    #                 to reduce with, or None for one per CPU
+    #  @param robust A boolean, true to reduce each shard about its own
+    #                center of mass and merge the shards with MomentAccumT
+    #  @param keep_points A boolean, true to keep the arrays in a
+    #                     LazyBodyT, which can be coarsened
+    #  @returns A BodyT built with vectorized reductions, or a LazyBodyT
+    #           of the arrays if keep_points is true
+    #  @throws ValueError under the same conditions as the constructor
+    @classmethod
+    def from_arrays(cls, x_s, y_s, m_s, workers=1, robust=False, keep_points=False):
+        if keep_points:
+            from LazyBodyT import LazyBodyT
+            return LazyBodyT(x_s, y_s, m_s, robust=robust)
+        x = np.asarray(x_s, dtype=np.float64)
+        y = np.asarray(y_s, dtype=np.float64)
+        m = np.asarray(m_s, dtype=np.float64)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if workers == 1:
+            return cls(x, y, m, robust=robust)
 
-        moment = self.__mmom__(x_s, y_s, m_s) - m * (cm_x**2 + cm_y**2)
-        self.moment = moment
+        return cls.__from_accum__(cls.__sharded__(x, y, m, workers, robust))
+
+    ## @brief Constructs a body robustly and estimates its error
+    #  @details The body is built as with robust=True, and the estimated
+    #           absolute error of its moment of inertia is returned
+    #           alongside, as a BodyT has no room to keep it
+    #  @param x_s A sequence or array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s A sequence or array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s A sequence or array-like of real numbers which
+    #             are the mass of each point mass
+    #  @param workers A natural number which is the number of threads
+    #                 to reduce arrays with, or None for one per CPU
+    #  @returns A tuple of the BodyT and a real number which is the
+    #           estimated absolute error of its moment of inertia
+    #  @throws ValueError under the same conditions as the constructor
+    @classmethod
+    def with_error(cls, x_s, y_s, m_s, workers=1):
+        if not(len(x_s) == len(y_s) and len(y_s) == len(m_s)):
+            raise ValueError
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        if workers == 1:
+            acc = cls.__robust_accum__(x_s, y_s, m_s)
+        else:
+            acc = cls.__sharded__(*(np.asarray(z, dtype=np.float64) for z in (x_s, y_s, m_s)),
+                                  workers, True)
+        return cls.from_moments(*acc.moments()), acc.error()
+
+    ## @brief Constructs a body by streaming point masses from an iterable
+    #  @details Only the running sums of the point masses are kept, so
+    #           memory stays constant regardless of the number of points
+    #  @param items An iterable of (x, y, m) triples, where each of x, y
+    #               and m is either a real number or an equal-length
+    #               array-like chunk of real numbers
+    #  @param robust A boolean, true to accumulate with a MomentAccumT
+    #  @returns A BodyT of all the streamed point masses
+    #  @throws ValueError if no point masses are streamed, if any mass is
+    #          not greater than zero, or if the chunks of a triple
+    #          aren't the same length
+    @classmethod
+    def from_iter(cls, items, robust=False):
+        acc = cls.__accum__(robust)
+        for x, y, m in items:
+            if np.ndim(m) == 0:
+                acc.add(x, y, m)
+            else:
+                acc.add_chunk(x, y, m)
+
+        return cls.__from_accum__(acc)
+
+    ## @brief Constructs a body from a memory-mapped .npy file
+    #  @details The file is never loaded into memory, the sums are reduced
+    #           directly over the mapped buffer in bounded-size chunks
+    #  @param path A string which is the path of a .npy file holding an
+    #              (N, 3) array whose rows are the (x, y, m) of each point
+    #  @param chunk A natural number which is the number of points
+    #               reduced at a time
+    #  @param robust A boolean, true to accumulate with a MomentAccumT
+    #  @returns A BodyT of all the point masses in the file
+    #  @throws ValueError if the array isn't (N, 3), if it holds no points,
+    #          or if any mass is not greater than zero
+    @classmethod
+    def from_npy(cls, path, chunk=1 << 20, robust=False):
+        return cls.__from_mapped__(np.load(path, mmap_mode='r'), chunk, robust)
+
+    ## @brief Constructs a body from a memory-mapped raw binary file
+    #  @details The file is never loaded into memory, the sums are reduced
+    #           directly over the mapped buffer in bounded-size chunks
+    #  @param path A string which is the path of a file of interleaved
+    #              little-endian float64 (x, y, m) triples
+    #  @param chunk A natural number which is the number of points
+    #               reduced at a time
+    #  @param robust A boolean, true to accumulate with a MomentAccumT
+    #  @returns A BodyT of all the point masses in the file
+    #  @throws ValueError if the file is empty or not a whole number of
+    #          triples, or if any mass is not greater than zero
+    @classmethod
+    def from_binary(cls, path, chunk=1 << 20, robust=False):
+        a = np.memmap(path, dtype='<f8', mode='r')
+        if a.size % 3 != 0:
+            raise ValueError
+
+        return cls.__from_mapped__(a.reshape(-1, 3), chunk, robust)
+
+    ## @brief helper method to reduce a mapped (N, 3) array chunk by chunk
+    #  @param a An (N, 3) array whose rows are the (x, y, m) of each point
+    #  @param chunk A natural number which is the number of points
+    #               reduced at a time
+    #  @param robust A boolean, true to accumulate with a MomentAccumT
+    #  @returns A BodyT of all the point masses in the array
+    #  @throws ValueError if the array isn't (N, 3), if it holds no points,
+    #          or if any mass is not greater than zero
+    @classmethod
+    def __from_mapped__(cls, a, chunk, robust=False):
+        if not(a.ndim == 2 and a.shape[1] == 3):
+            raise ValueError
+
+        acc = cls.__accum__(robust)
+        for i in range(0, a.shape[0], chunk):
+            rows = a[i:i + chunk]
+            acc.add_chunk(rows[:, 0], rows[:, 1], rows[:, 2])
+
+        return cls.__from_accum__(acc)
+
+    ## @brief Constructs a body from the sums of its point masses
+    #  @param m A real number which is the total mass of the points
+    #  @param mx A real number which is the sum of m * x over the points
+    #  @param my A real number which is the sum of m * y over the points
+    #  @param mr2 A real number which is the sum of m * (x^2 + y^2)
+    #             over the points
+    #  @returns A BodyT with the given sums
+    #  @throws ValueError if the total mass is not greater than zero
+    @classmethod
+    def from_sums(cls, m, mx, my, mr2):
+        if not(m > 0):
+            raise ValueError
+
+        b = cls.__new__(cls)
+        b.__set_sums__(m, mx, my, mr2)
+        return b
+
+    ## @brief Constructs a body from its mass, center of mass and moment
+    #  @param m A real number which is the total mass of the points
+    #  @param cm_x A real number which is the x-component of the center
+    #              of mass
+    #  @param cm_y A real number which is the y-component of the center
+    #              of mass
+    #  @param moment A real number which is the moment of inertia about
+    #                the center of mass
+    #  @returns A BodyT with the given moments
+    #  @throws ValueError if the total mass is not greater than zero
+    @classmethod
+    def from_moments(cls, m, cm_x, cm_y, moment):
+        if not(m > 0):
+            raise ValueError
+
+        b = cls.__new__(cls)
+        b.__set_moments__(m, cm_x, cm_y, moment)
+        return b
 
     ## @brief Getter for x-component of center of mass
     #  @returns A real number which is the x-component
@@ -63,32 +253,166 @@ class BodyT(Shape):
     def m_inert(self):
         return self.moment
 
-    ## @brief helper method to calculate center of mass of body
-    #  @param z A sequence of real numbers which are 1-dimensional positions
+    ## @brief Makes a stand-in geometry of k point masses for the body
+    #  @details The point masses are k equal masses evenly spaced on a
+    #           circle about the center of mass, whose radius gives the
+    #           same moment of inertia. They are synthetic, not a
+    #           clustering of the body's points.
+    #  @param k A natural number which is the number of point masses
+    #  @returns A LazyBodyT of k point masses with the same mass, center of
+    #           mass and moment of inertia as the body
+    #  @throws ValueError if k is less than 1, or is 1 and the moment of
+    #          inertia is not zero
+    def ring(self, k):
+        from LazyBodyT import LazyBodyT
+        if not(k >= 2 or (k == 1 and self.m_inert() == 0)):
+            raise ValueError
+
+        radius = np.sqrt(max(self.m_inert(), 0) / self.mass())
+        angle = 2 * np.pi * np.arange(k) / k
+        return LazyBodyT(self.cm_x() + radius * np.cos(angle),
+                         self.cm_y() + radius * np.sin(angle),
+                         np.full(k, self.mass() / k))
+
+    ## @brief helper method to set the state of the body from its sums
+    #  @param m A real number which is the total mass of the points
+    #  @param mx A real number which is the sum of m * x over the points
+    #  @param my A real number which is the sum of m * y over the points
+    #  @param mr2 A real number which is the sum of m * (x^2 + y^2)
+    #             over the points
+    def __set_sums__(self, m, mx, my, mr2):
+        cm_x = mx / m
+        cm_y = my / m
+
+        self.__set_moments__(m, cm_x, cm_y, mr2 - m * (cm_x**2 + cm_y**2))
+
+    ## @brief helper method to set the state of the body from its moments
+    #  @param m A real number which is the total mass of the points
+    #  @param cm_x A real number which is the x-component of the cm
+    #  @param cm_y A real number which is the y-component of the cm
+    #  @param moment A real number which is the moment of inertia
+    def __set_moments__(self, m, cm_x, cm_y, moment):
+        self.cmx = cm_x
+        self.cmy = cm_y
+        self.m = m
+        self.moment = moment
+
+    ## @brief helper method to sum the point masses of a sequence exactly
+    #  @param x A sequence of real numbers which are the x-coords of the points
+    #  @param y A sequence of real numbers which are the y-coords of the points
     #  @param m A sequence of real numbers which are the masses of the points
-    #  @return A real number which is the 1-d center of mass of the points
-    def __cm__(self, z, m):
-        weighted_sum = 0
-        for i in range(len(z)):
-            weighted_sum += z[i] * m[i]
+    #  @return The total mass, sum of m * x, sum of m * y
+    #          and sum of m * (x^2 + y^2) of the points
+    #  @throws ValueError if any of the masses is not greater than zero
+    def __seq_sums__(self, x, y, m):
+        mx = 0
+        my = 0
+        mr2 = 0
+        for xi, yi, mi in zip(x, y, m):
+            if not(mi > 0):
+                raise ValueError
+            mx += xi * mi
+            my += yi * mi
+            mr2 += mi * (xi**2 + yi**2)
+
+        return sum(m), mx, my, mr2
 
-        return weighted_sum / sum(m)
+    ## @brief helper method to sum the point masses of arrays in a
+    #         handful of vectorized reductions
+    #  @param x An array-like of real numbers which are the x-coords
+    #  @param y An array-like of real numbers which are the y-coords
+    #  @param m An array-like of real numbers which are the masses
+    #  @return The total mass, sum of m * x, sum of m * y
+    #          and sum of m * (x^2 + y^2) of the points
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def __array_sums__(self, x, y, m):
+        acc = BodyAccumT()
+        acc.add_chunk(x, y, m)
+        return acc.sums()
 
-    ## @brief helper method to calculate the moment of inertia of the body
+    ## @brief helper method to accumulate the moments of the point masses
+    #         about their center of mass
     #  @param x A sequence of real numbers which are the x-coords of the points
     #  @param y A sequence of real numbers which are the y-coords of the points
     #  @param m A sequence of real numbers which are the masses of the points
-    #  @return A real number which helps calculate the moment of inertia
-    def __mmom__(self, x, y, m):
+    #  @return A MomentAccumT of the points
+    #  @throws ValueError if any of the masses is not greater than zero
+    @staticmethod
+    def __robust_accum__(x, y, m):
+        acc = MomentAccumT()
+        if any(isinstance(z, np.ndarray) for z in (x, y, m)):
+            acc.add_chunk(x, y, m)
+        else:
+            for xi, yi, mi in zip(x, y, m):
+                acc.add(xi, yi, mi)
+        return acc
 
-        running_sum = 0
-        for i in range(len(x)):
-            running_sum += m[i] * (x[i]**2 + y[i]**2)
+    ## @brief helper method to reduce arrays shard by shard on a thread pool
+    #  @param x An array of real numbers which are the x-coords of the points
+    #  @param y An array of real numbers which are the y-coords of the points
+    #  @param m An array of real numbers which are the masses of the points
+    #  @param workers A natural number which is the number of threads
+    #  @param robust A boolean, true to reduce into a MomentAccumT
+    #  @return An accumulator of all the points, merged from the shards
+    #  @throws ValueError if the arrays aren't the same length or if any
+    #          of the masses is not greater than zero
+    @classmethod
+    def __sharded__(cls, x, y, m, workers, robust):
+        if not(len(x) == len(y) and len(y) == len(m)):
+            raise ValueError
+
+        shards = zip(np.array_split(x, workers), np.array_split(y, workers),
+                     np.array_split(m, workers))
+        acc = cls.__accum__(robust)
+        with ThreadPoolExecutor(workers) as pool:
+            for part in pool.map(cls.__shard_sums__, shards, [robust] * workers):
+                acc.merge(part)
+        return acc
+
+    ## @brief helper method to reduce one shard of the point masses
+    #  @param shard A tuple (x, y, m) of equal-length arrays
+    #  @param robust A boolean, true to reduce into a MomentAccumT
+    #  @return An accumulator holding the partial sums of the shard
+    #  @throws ValueError if any of the masses is not greater than zero
+    @staticmethod
+    def __shard_sums__(shard, robust=False):
+        acc = BodyT.__accum__(robust)
+        acc.add_chunk(*shard)
+        return acc
 
-        return running_sum
+    ## @brief helper method to make an empty accumulator
+    #  @param robust A boolean, true for a MomentAccumT
+    #  @return A MomentAccumT if robust, otherwise a BodyAccumT
+    @staticmethod
+    def __accum__(robust):
+        return MomentAccumT() if robust else BodyAccumT()
+
+    ## @brief helper method to build a body from a filled accumulator
+    #  @param acc A BodyAccumT or MomentAccumT
+    #  @return A BodyT of the point masses in the accumulator
+    #  @throws ValueError if the accumulator is empty
+    @classmethod
+    def __from_accum__(cls, acc):
+        if isinstance(acc, MomentAccumT):
+            return cls.from_moments(*acc.moments())
+        return cls.from_sums(*acc.sums())
 
     ## @brief Method to help with object comparison when testing
     #  @param other Another shape to test for equality
-    #  @returns A boolean, true iff both objects have the same state variables
+    #  @returns A boolean, true iff both objects are the same type of shape
+    #           with the same state variables
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.__key__() == other.__key__()
+
+    ## @brief Method to allow the body to be used as a dict or set key
+    #  @returns An integer hash, consistent with __eq__
+    def __hash__(self):
+        return hash(self.__key__())
+
+    ## @brief helper method to collect the state variables of the body
+    #  @return A tuple of the state variables of the body
+    def __key__(self):
+        return (self.cmx, self.cmy, self.m, self.moment)
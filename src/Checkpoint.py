@@ -0,0 +1,81 @@
+## @file Checkpoint.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which holds the state a simulation can resume from
+#  @date Oct. 17, 2026
+
+import json
+import math
+
+## @brief Defines a checkpoint ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Holds the time and the x, y, v_x, v_y state at the end of a
+#           simulation. A checkpoint converts to and from a dictionary or
+#           a JSON string, so a long run can be split into segments which
+#           are resumed by other jobs.
+
+
+class Checkpoint:
+    ## @brief Constructor for Checkpoint
+    #  @param t A real number which is the time of the checkpoint
+    #  @param w A sequence of 4 real numbers which is the state x, y, v_x,
+    #         v_y at time t
+    #  @throws ValueError if w doesn't have 4 entries, or if t or any of
+    #          them isn't finite
+    def __init__(self, t, w):
+        self.t = float(t)
+        self.w = tuple(float(wi) for wi in w)
+        if not(len(self.w) == 4 and all(map(math.isfinite, (self.t,) + self.w))):
+            raise ValueError
+
+    ## @brief Getter for the time of the checkpoint
+    #  @returns A real number which is the time of the checkpoint
+    def time(self):
+        return self.t
+
+    ## @brief Getter for the state at the checkpoint
+    #  @returns A tuple of real numbers x, y, v_x, v_y
+    def state(self):
+        return self.w
+
+    ## @brief Converts the checkpoint to a dictionary
+    #  @returns A dictionary with the time 't' and a list 'w' of the state
+    def to_dict(self):
+        return {'t': self.t, 'w': list(self.w)}
+
+    ## @brief Constructs a checkpoint from a dictionary
+    #  @param d A dictionary as returned by to_dict
+    #  @returns A Checkpoint with the time and state in d
+    #  @throws ValueError if d doesn't hold a valid time and state
+    @classmethod
+    def from_dict(cls, d):
+        if not(isinstance(d, dict) and 't' in d and 'w' in d):
+            raise ValueError
+        return cls(d['t'], d['w'])
+
+    ## @brief Converts the checkpoint to a JSON string
+    #  @details Real numbers are written with enough digits to be read
+    #           back exactly
+    #  @returns A string which is the checkpoint in JSON
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    ## @brief Constructs a checkpoint from a JSON string
+    #  @param s A string as returned by to_json
+    #  @returns A Checkpoint with the time and state in s
+    #  @throws ValueError if s isn't JSON of a valid time and state
+    @classmethod
+    def from_json(cls, s):
+        return cls.from_dict(json.loads(s))
+
+    ## @brief Checks if two checkpoints are equal
+    #  @param other The object to compare against
+    #  @returns True if other is a Checkpoint with the same time and state
+    def __eq__(self, other):
+        if not isinstance(other, Checkpoint):
+            return NotImplemented
+        return (self.t, self.w) == (other.t, other.w)
+
+    ## @brief Hashes the checkpoint
+    #  @returns An integer hash, consistent with __eq__
+    def __hash__(self):
+        return hash((self.t, self.w))
@@ -7,10 +7,14 @@ from Shape import Shape
 
 ## @brief Defines a circle ADT. Assumption: Assume all inputs
 #         provided to methods are of the correct type
-#  @details Extends the Shape interface
+#  @details Extends the Shape interface.
+#           Instances have no __dict__ and take at most 64 bytes
+#           (as reported by sys.getsizeof) besides their field values.
 
 
 class CircleT(Shape):
+    __slots__ = ('x', 'y', 'r', 'm')
+
     ## @brief Constructor for CircleT
     #  @param x A real number which is the x-component of the center of mass
     #  @param y A real number which is the y-component of the center of mass
@@ -48,8 +52,26 @@ class CircleT(Shape):
     def m_inert(self):
         return self.m * (self.r**2) / 2
 
+    ## @brief Getter for the radius of the circle
+    #  @returns A real number which is the radius of the circle
+    def radius(self):
+        return self.r
+
     ## @brief Method to help with object comparison when testing
     #  @param other Another shape to test for equality
-    #  @returns A boolean, true iff both objects have the same state variables
+    #  @returns A boolean, true iff both objects are the same type of shape
+    #           with the same state variables
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.__key__() == other.__key__()
+
+    ## @brief Method to allow the circle to be used as a dict or set key
+    #  @returns An integer hash, consistent with __eq__
+    def __hash__(self):
+        return hash(self.__key__())
+
+    ## @brief helper method to collect the state variables of the circle
+    #  @return A tuple of the state variables of the circle
+    def __key__(self):
+        return (self.x, self.y, self.r, self.m)
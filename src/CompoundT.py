@@ -0,0 +1,105 @@
+## @file CompoundT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which specifies a compound shape
+#         (an assembly of other shapes)
+#  @date Oct. 17, 2026
+
+from Shape import Shape
+from BodyAccumT import BodyAccumT
+
+## @brief Defines a compound shape ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the Shape interface. The parts are combined using only
+#           their mass, center of mass and moment of inertia through the
+#           parallel axis theorem, so summarizing an assembly costs
+#           O(number of parts). Parts may themselves be compound shapes.
+
+
+class CompoundT(Shape):
+    ## @brief Constructor for CompoundT
+    #  @param parts A sequence of Shape objects which make up the assembly
+    #  @throws ValueError if there are no parts
+    def __init__(self, parts):
+        if len(parts) == 0:
+            raise ValueError
+
+        self.parts = list(parts)
+        self.__summarize__()
+
+    ## @brief Getter for the parts of the assembly
+    #  @returns A sequence of Shape objects which make up the assembly
+    def get_parts(self):
+        return self.parts
+
+    ## @brief Adds a part to the assembly in constant time
+    #  @param s A Shape object which is to be added to the assembly
+    #  @returns A natural number which is the index of the new part
+    def add_part(self, s):
+        self.parts.append(s)
+        self.summ.append(self.__summary__(s))
+        self.acc.add(*self.summ[-1])
+        return len(self.parts) - 1
+
+    ## @brief Replaces a part of the assembly in constant time
+    #  @details Also used to re-summarize a part which has changed, by
+    #           passing the same part again
+    #  @param i A natural number which is the index of the part
+    #  @param s A Shape object which replaces the part
+    #  @throws IndexError if there is no part at index i
+    def set_part(self, i, s):
+        self.acc.remove(*self.summ[i])
+        self.parts[i] = s
+        self.summ[i] = self.__summary__(s)
+        self.acc.add(*self.summ[i])
+
+    ## @brief Re-summarizes every part of the assembly
+    #  @details Needed after parts were changed in place, and clears any
+    #           rounding drift left by replacing parts
+    def refresh(self):
+        self.__summarize__()
+
+    ## @brief Getter for x-component of center of mass
+    #  @returns A real number which is the x-component
+    #           of the assembly's center of mass
+    def cm_x(self):
+        return self.acc.mx / self.acc.m
+
+    ## @brief Getter for y-component of center of mass
+    #  @returns A real number which is the y-component
+    #           of the assembly's center of mass
+    def cm_y(self):
+        return self.acc.my / self.acc.m
+
+    ## @brief Getter for mass of the assembly
+    #  @returns A real number which is the mass of the assembly
+    def mass(self):
+        return self.acc.m
+
+    ## @brief Getter for moment of inertia of the assembly
+    #  @returns A real number which is the moment of inertia of the
+    #           assembly about its center of mass
+    def m_inert(self):
+        m, mx, my, mr2 = self.acc.sums()
+        cm_x = mx / m
+        cm_y = my / m
+        return mr2 - m * (cm_x**2 + cm_y**2)
+
+    ## @brief helper method to summarize every part from scratch
+    def __summarize__(self):
+        self.summ = [self.__summary__(s) for s in self.parts]
+        self.acc = BodyAccumT()
+        for summary in self.summ:
+            self.acc.add(*summary)
+
+    ## @brief helper method to summarize a part
+    #  @param s A Shape object which is a part of the assembly
+    #  @return A tuple (x, y, m, inert) which is the center of mass,
+    #          mass and moment of inertia of the part
+    def __summary__(self, s):
+        return s.cm_x(), s.cm_y(), s.mass(), s.m_inert()
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another shape to test for equality
+    #  @returns A boolean, true iff both objects have the same state variables
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
@@ -0,0 +1,19 @@
+## @file ConstForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a constant force ADT
+#  @date Oct. 17, 2026
+
+from PolyForceT import PolyForceT
+
+## @brief Defines a constant force ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends PolyForceT, as the polynomial of degree 0
+
+
+class ConstForceT(PolyForceT):
+    __slots__ = ()
+
+    ## @brief Constructor for ConstForceT
+    #  @param f A real number which is the force at every time
+    def __init__(self, f):
+        super().__init__([f])
@@ -0,0 +1,41 @@
+## @file Force.py
+#  @author Mihail Serafimovski
+#  @brief Defines the force module
+#  @date Oct. 17, 2026
+#  @details The force module describes the force functions of a scene.
+#           A force function may declare the times at which it jumps in a
+#           breakpoints attribute, which the integrators use to simulate
+#           the motion segment by segment instead of stepping over them.
+
+import numpy as np
+
+
+## @brief Declares the breakpoints of a force function
+#  @param F A function which inputs and outputs real numbers
+#  @param breakpoints A sequence of real numbers which are the times at
+#         which F may jump or have a kink
+#  @returns A function which equals F and has the breakpoints, sorted, in
+#           its breakpoints attribute
+
+
+def with_breakpoints(F, breakpoints):
+    def force(t):
+        return F(t)
+
+    force.breakpoints = tuple(sorted(set(map(float, breakpoints))))
+    force.vectorized = getattr(F, 'vectorized', False)
+    return force
+
+
+## @brief Collects the breakpoints of forces within an interval
+#  @param forces A sequence of force functions
+#  @param t_start A real number which is the start of the interval
+#  @param t_end A real number which is the end of the interval
+#  @returns A sorted array of the distinct breakpoints declared by any of
+#           the forces which lie strictly between t_start and t_end
+
+
+def breakpoints(forces, t_start, t_end):
+    b = np.array([bk for F in forces for bk in getattr(F, 'breakpoints', ())],
+                 dtype=np.float64)
+    return np.unique(b[(b > t_start) & (b < t_end)])
@@ -0,0 +1,97 @@
+## @file ForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a force interface module
+#  @date Oct. 17, 2026
+
+import hashlib
+from abc import ABC, abstractmethod
+
+import numpy as np
+
+## @brief ForceT defines a force interface module
+#  @details A force is a function of time which can be called like any
+#   other force function of a scene, on a real number or on a whole array
+#   of times, and which knows its exact antiderivative, its breakpoints
+#   and a fingerprint of itself. The abstract methods need to be
+#   overwritten by classes that inherit it.
+
+
+class ForceT(ABC):
+    __slots__ = ()
+
+    ## @brief Forces are evaluated on whole arrays of times at once
+    vectorized = True
+
+    @abstractmethod
+    ## @brief A generic method evaluating the force
+    #  @param t A 1-D array of real numbers which are times
+    #  @return An array of real numbers which is the force at each time
+    def at(self, t):
+        pass
+
+    @abstractmethod
+    ## @brief A generic method giving the antiderivative of the force
+    #  @return A ForceT which is the antiderivative of the force, zero at
+    #          time 0 and continuous
+    def antideriv(self):
+        pass
+
+    @abstractmethod
+    ## @brief helper method to collect the state variables of the force
+    #  @return A tuple of the name of the class and its state variables
+    def __key__(self):
+        pass
+
+    ## @brief Getter for the breakpoints of the force
+    #  @return A sorted tuple of the times at which the force may jump
+    @property
+    def breakpoints(self):
+        return ()
+
+    ## @brief Evaluates the force
+    #  @param t A real number or an array-like of real numbers
+    #  @return A real number, or an array of real numbers of the same
+    #          shape as t, which is the force at t
+    def __call__(self, t):
+        ta = np.asarray(t, dtype=np.float64)
+        f = self.at(ta.reshape(-1)).reshape(ta.shape)
+        return float(f) if f.ndim == 0 else f
+
+    ## @brief A fingerprint of the force, stable across processes
+    #  @return A string which is a hash of the state variables
+    def fingerprint(self):
+        return hashlib.sha256(repr(self.__key__()).encode()).hexdigest()
+
+    ## @brief Adds two forces
+    #  @param other A ForceT
+    #  @return A SumForceT of the two forces
+    def __add__(self, other):
+        from SumForceT import SumForceT
+        if not isinstance(other, ForceT):
+            return NotImplemented
+        return SumForceT([self, other])
+
+    ## @brief Scales the force
+    #  @param c A real number
+    #  @return A ScaledForceT which is the force scaled by c
+    def __mul__(self, c):
+        from ScaledForceT import ScaledForceT
+        if isinstance(c, ForceT):
+            return NotImplemented
+        return ScaledForceT(self, c)
+
+    __rmul__ = __mul__
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another force to test for equality
+    #  @return A boolean, true iff both objects are forces with the same
+    #          state variables
+    def __eq__(self, other):
+        if not isinstance(other, ForceT):
+            return NotImplemented
+        return self.__key__() == other.__key__()
+
+    ## @brief Method to allow the force to be used as a dict or set key
+    #  @return An integer hash, consistent with __eq__
+    def __hash__(self):
+        return hash(self.__key__())
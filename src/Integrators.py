@@ -0,0 +1,307 @@
+## @file Integrators.py
+#  @author Mihail Serafimovski
+#  @brief Defines the integrators module
+#  @date Oct. 17, 2026
+#  @details The integrators module keeps a registry of backends which
+#           solve the motion of a shape under forces that only depend on
+#           time. Every backend is a function
+#           backend(F_x, F_y, mass, w0, t, opts) which returns a tuple
+#           (w, nfev, dense): the array of states x, y, v_x, v_y at each
+#           time step, the number of right-hand side evaluations (each
+#           evaluating both forces at one time), and a dense output
+#           function of time (or None if the backend has none). opts is a
+#           dictionary with the keys rtol, atol and max_step, whose values
+#           are None to keep the backend's defaults.
+
+import numpy as np
+import scipy.integrate as sp
+
+## @brief Maps the name of each backend to its function
+BACKENDS = {}
+
+## @brief The methods of scipy's solve_ivp which are registered as backends
+IVP_METHODS = ('RK45', 'RK23', 'DOP853', 'Radau', 'BDF', 'LSODA')
+
+## @brief The fixed-step backends, which evaluate the forces on the whole
+#         time grid at once and can simulate a batch of systems
+GRID_METHODS = ('quad', 'rk4', 'verlet')
+
+
+## @brief Registers a backend under a name
+#  @param name A string which is the name of the backend
+#  @param backend A function with the backend signature described above
+
+
+def register(name, backend):
+    BACKENDS[name] = backend
+
+
+## @brief Looks up a backend by name
+#  @param name A string which is the name of the backend
+#  @returns The function of the backend
+#  @throws ValueError if no backend is registered under the name
+
+
+def get(name):
+    if name not in BACKENDS:
+        raise ValueError
+    return BACKENDS[name]
+
+
+## @brief Evaluates a force over an array of times
+#  @details Force functions with a true vectorized attribute are called
+#           once on the whole array, any other function once per time.
+#           A vectorized function may return an array with leading axes
+#           (one entry per system of a batch) and time as the last axis,
+#           in which case the fixed-step backends simulate every system.
+#  @param F A function which inputs and outputs real numbers
+#  @param t An array of real numbers which are the times
+#  @returns An array of real numbers which is F at each time
+
+
+def force_grid(F, t):
+    if getattr(F, 'vectorized', False):
+        f = np.asarray(F(t), dtype=np.float64)
+        return f if f.ndim > t.ndim else np.broadcast_to(f, t.shape)
+    return np.fromiter(map(F, t), dtype=np.float64, count=len(t))
+
+
+## @brief Integrates with a backend segment by segment
+#  @details The time steps are split at the breakpoints, and each segment
+#           is integrated from the state at the end of the previous one.
+#           A segment ending at a breakpoint b stops just short of it, at
+#           the largest float below b, so the forces are only ever
+#           evaluated on one side of each jump within a segment.
+#  @param backend A function with the backend signature described above
+#  @param breaks A sorted array of the breakpoints strictly between the
+#         first and last time steps
+#  @param F_x A function which is the force in the x-direction
+#  @param F_y A function which is the force in the y-direction
+#  @param mass A real number which is the mass of the shape
+#  @param w0 A sequence of real numbers which is the initial state
+#  @param t An array of real numbers which are the time steps
+#  @param opts A dictionary of the backend's rtol, atol and max_step
+#  @returns A tuple (w, nfev, dense) as a backend returns, where nfev is
+#           summed over the segments and dense covers all of them if
+#           every segment has dense output
+
+
+def segmented(backend, breaks, F_x, F_y, mass, w0, t, opts):
+    if len(breaks) == 0:
+        return backend(F_x, F_y, mass, w0, t, opts)
+
+    w = np.empty((len(t), 4))
+    starts = np.concatenate(([t[0]], breaks))
+    ends = np.concatenate((np.nextafter(breaks, -np.inf), [t[-1]]))
+    cuts = np.searchsorted(t, starts, side='left')
+    cuts[0] = 0
+    nfev = 0
+    denses = []
+    for k in range(len(starts)):
+        lo = cuts[k]
+        hi = cuts[k + 1] if k + 1 < len(starts) else len(t)
+        inner = t[lo:hi]
+        between = inner[(inner > starts[k]) & (inner < ends[k])]
+        ts = np.concatenate(([starts[k]], between, [ends[k]]))
+        ws, n, dense = backend(F_x, F_y, mass, w0, ts, opts)
+        w[lo:hi] = ws[np.searchsorted(ts, inner)]
+        w0 = ws[-1]
+        nfev += n
+        denses.append(dense)
+
+    if any(d is None for d in denses):
+        return w, nfev, None
+    return w, nfev, __joined__(starts, denses)
+
+
+## @brief helper function to join the dense outputs of segments
+#  @param starts An array of real numbers which are the segment starts
+#  @param denses A sequence of dense output functions, one per segment
+#  @returns A dense output function over all of the segments
+
+
+def __joined__(starts, denses):
+    def dense(tq):
+        tq = np.asarray(tq, dtype=np.float64)
+        flat = tq.ravel()
+        seg = np.searchsorted(starts, flat, side='right') - 1
+        seg = np.clip(seg, 0, len(starts) - 1)
+        out = np.empty((4, len(flat)))
+        for k, d in enumerate(denses):
+            mask = seg == k
+            if np.any(mask):
+                out[:, mask] = d(flat[mask])
+        return out.reshape((4,) + tq.shape)
+
+    return dense
+
+
+## @brief Backend using scipy's odeint
+#  @details The last time is passed as a critical time, so odeint never
+#           steps past it, and a segment ending just before a breakpoint
+#           never evaluates the forces beyond the breakpoint
+
+
+def odeint(F_x, F_y, mass, w0, t, opts):
+    nfev = [0]
+
+    def ode(w, t):
+        nfev[0] += 1
+        return w[2], w[3], F_x(t) / mass, F_y(t) / mass
+
+    kwargs = {'rtol': opts['rtol'], 'atol': opts['atol'], 'tcrit': [t[-1]]}
+    if opts['max_step'] is not None:
+        kwargs['hmax'] = opts['max_step']
+    return sp.odeint(ode, w0, t, **kwargs), nfev[0], None
+
+
+## @brief Makes a backend using one of the methods of scipy's solve_ivp
+#  @param method A string which is one of IVP_METHODS
+#  @returns A backend function with dense output
+
+
+def ivp(method):
+    def backend(F_x, F_y, mass, w0, t, opts):
+        def rhs(t, w):
+            return w[2], w[3], F_x(t) / mass, F_y(t) / mass
+
+        kwargs = {k: v for k, v in opts.items() if v is not None}
+        sol = sp.solve_ivp(rhs, (t[0], t[-1]), w0, method=method, t_eval=t,
+                           dense_output=True, **kwargs)
+        if not sol.success:
+            raise ValueError
+        return sol.y.T, sol.nfev, sol.sol
+
+    return backend
+
+
+## @brief Backend integrating by cumulative quadrature
+#  @details The acceleration is taken to be linear between time steps,
+#           which makes the updates exact for forces which are piecewise
+#           linear on the time grid
+
+
+def quad(F_x, F_y, mass, w0, t, opts):
+    h = np.diff(t)
+    a = [force_grid(F, t) / mass for F in (F_x, F_y)]
+    dv = [h * (ai[..., :-1] + ai[..., 1:]) / 2 for ai in a]
+    dz = [h * h * (2 * ai[..., :-1] + ai[..., 1:]) / 6 for ai in a]
+    return __fixed_step__(w0, h, dv, dz), len(t), None
+
+
+## @brief Backend using the classic fixed-step Runge-Kutta method
+#  @details As the forces don't depend on the state, each step only needs
+#           the forces at the step's ends and midpoint, so every stage is
+#           evaluated on the whole time grid at once
+
+
+def rk4(F_x, F_y, mass, w0, t, opts):
+    h = np.diff(t)
+    mid = t[:-1] + h / 2
+    a = [force_grid(F, t) / mass for F in (F_x, F_y)]
+    a_mid = [force_grid(F, mid) / mass for F in (F_x, F_y)]
+    dv = [h * (ai[..., :-1] + 4 * am + ai[..., 1:]) / 6 for ai, am in zip(a, a_mid)]
+    dz = [h * h * (ai[..., :-1] + 2 * am) / 6 for ai, am in zip(a, a_mid)]
+    return __fixed_step__(w0, h, dv, dz), len(t) + len(mid), None
+
+
+## @brief Backend using the fixed-step velocity Verlet method
+
+
+def verlet(F_x, F_y, mass, w0, t, opts):
+    h = np.diff(t)
+    a = [force_grid(F, t) / mass for F in (F_x, F_y)]
+    dv = [h * (ai[..., :-1] + ai[..., 1:]) / 2 for ai in a]
+    dz = [h * h * ai[..., :-1] / 2 for ai in a]
+    return __fixed_step__(w0, h, dv, dz), len(t), None
+
+
+## @brief Backend computing the motion in closed form
+#  @details Needs forces with an antideriv method, such as the ForceT
+#           forces. The velocity is found from the antiderivative of each
+#           force and the position from its second antiderivative, so no
+#           right-hand side is evaluated.
+#  @throws ValueError if a force has no antiderivative
+
+
+def exact(F_x, F_y, mass, w0, t, opts):
+    if not all(__integrable__(F) for F in (F_x, F_y)):
+        raise ValueError
+    A1 = [F.antideriv() for F in (F_x, F_y)]
+    A2 = [A.antideriv() for A in A1]
+    t0 = t[0]
+    a1_0 = [A(t0) for A in A1]
+    a2_0 = [A(t0) for A in A2]
+
+    def dense(tq):
+        tq = np.asarray(tq, dtype=np.float64)
+        w = np.empty((4,) + tq.shape)
+        for i in (0, 1):
+            w[i + 2] = w0[i + 2] + (A1[i](tq) - a1_0[i]) / mass
+            dt = tq - t0
+            dz = (A2[i](tq) - a2_0[i] - a1_0[i] * dt) / mass
+            w[i] = w0[i] + w0[i + 2] * dt + dz
+        return w
+
+    return dense(t).T, 0, dense
+
+
+## @brief Backend choosing the closed form when it can
+#  @details Uses the exact backend if both forces have an antiderivative,
+#           and odeint otherwise
+
+
+def auto(F_x, F_y, mass, w0, t, opts):
+    if all(__integrable__(F) for F in (F_x, F_y)):
+        return exact(F_x, F_y, mass, w0, t, opts)
+    return odeint(F_x, F_y, mass, w0, t, opts)
+
+
+## @brief helper function to check whether a force has an antiderivative
+#  @param F A function which inputs and outputs real numbers
+#  @returns True if F has an antideriv method
+
+
+def __integrable__(F):
+    return callable(getattr(F, 'antideriv', None))
+
+
+## @brief helper function to accumulate fixed-step updates
+#  @details The position update of each step is h * v plus the given
+#           acceleration term, with v the velocity at the start of the step.
+#           The state is kept component by component with time as the
+#           leading axis in memory, the layout of a batch's forces, and
+#           the result is a view of it, so no pass writes strided memory.
+#  @param w0 A sequence of real numbers which is the initial state, or a
+#            sequence of 4 arrays for a batch of systems
+#  @param h An array of real numbers which are the step sizes
+#  @param dv A pair of arrays which are the x and y velocity updates,
+#            with time as the last axis
+#  @param dz A pair of arrays which are the x and y acceleration terms
+#            of the position updates, with time as the last axis
+#  @returns An array with one row x, y, v_x, v_y per time step, with the
+#           leading axes of the batch if there are any
+
+
+def __fixed_step__(w0, h, dv, dz):
+    w0 = np.asarray(w0, dtype=np.float64)
+    w = np.moveaxis(np.empty((4, len(h) + 1) + np.shape(dv[0])[:-1]), 1, -1)
+    w[..., 0] = w0
+    for i in (0, 1):
+        np.cumsum(dv[i], axis=-1, out=w[i + 2, ..., 1:])
+        w[i + 2, ..., 1:] += w0[i + 2][..., np.newaxis]
+        dz_i = h * w[i + 2, ..., :-1] + dz[i]
+        np.cumsum(dz_i, axis=-1, out=w[i, ..., 1:])
+        w[i, ..., 1:] += w0[i][..., np.newaxis]
+
+    return np.moveaxis(w, 0, -1)
+
+
+register('odeint', odeint)
+register('quad', quad)
+register('rk4', rk4)
+register('verlet', verlet)
+register('exact', exact)
+register('auto', auto)
+for name in IVP_METHODS:
+    register(name, ivp(name))
@@ -0,0 +1,273 @@
+## @file KdTreeT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a k-d tree ADT for regional mass queries
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+import Ranges
+from BodyT import BodyT
+
+## @brief Defines a k-d tree ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Indexes a collection of point masses with a balanced 2-d tree.
+#           Every node keeps the sums m, m x, m y and m (x^2 + y^2) of its
+#           points and their bounding box, with the coordinates taken
+#           relative to the center of mass of all the points to keep the
+#           sums well conditioned. A region query adds up the nodes which
+#           lie inside the region, only descends into the nodes which
+#           cross its boundary, and tests single points only in the leaves
+#           which do, so it visits O(log N + boundary) nodes. Queries are
+#           answered in batches, walking the tree level by level for all
+#           of them at once.
+
+
+class KdTreeT:
+    ## @brief Constructor for KdTreeT
+    #  @details Each node is split at the median of its points along the
+    #           longer side of its bounding box
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @param leaf_size A natural number which is the largest number of
+    #         points in a leaf
+    #  @throws ValueError if the arrays aren't the same length, if there
+    #          are no points, or if any of the masses is not greater
+    #          than zero
+    def __init__(self, x_s, y_s, m_s, leaf_size=16):
+        x = np.asarray(x_s, dtype=np.float64)
+        y = np.asarray(y_s, dtype=np.float64)
+        m = np.asarray(m_s, dtype=np.float64)
+        n = len(m)
+        if not(n > 0 and x.shape == (n,) and y.shape == (n,) and leaf_size >= 1):
+            raise ValueError
+        if not np.all(m > 0):
+            raise ValueError
+
+        self.ox = float(np.dot(m, x) / m.sum())
+        self.oy = float(np.dot(m, y) / m.sum())
+        self.x = x - self.ox
+        self.y = y - self.oy
+        self.m = m.copy()
+        self.visited = 0
+        self.levels = []
+
+        start = np.array([0])
+        end = np.array([n])
+        while True:
+            level = self.__level__(start, end, leaf_size)
+            self.levels.append(level)
+            split = ~level['leaf']
+            level['first'] = np.cumsum(split) * 2 - 2
+            if not np.any(split):
+                break
+            self.__split__(start[split], end[split], level['wide_x'][split])
+            mid = (start[split] + end[split]) // 2
+            start = np.stack([start[split], mid], axis=1).ravel()
+            end = np.stack([mid, end[split]], axis=1).ravel()
+
+    ## @brief Getter for the number of point masses
+    #  @returns A natural number which is the number of point masses
+    def __len__(self):
+        return len(self.m)
+
+    ## @brief Getter for the number of nodes and points visited
+    #  @returns A natural number which is the number of (query, node) and
+    #           (query, point) pairs examined by the last query
+    def get_visited(self):
+        return self.visited
+
+    ## @brief The point masses inside a rectangle
+    #  @param x0 A real number which is the left side of the rectangle
+    #  @param y0 A real number which is the bottom side of the rectangle
+    #  @param x1 A real number which is the right side of the rectangle
+    #  @param y1 A real number which is the top side of the rectangle
+    #  @returns A BodyT of the point masses in the closed rectangle
+    #  @throws ValueError if there are no point masses in it
+    def rect(self, x0, y0, x1, y1):
+        return self.__body__(self.__walk__(self.__rect__, [[x0], [y0], [x1], [y1]], 2))
+
+    ## @brief The point masses inside a circle
+    #  @param cx A real number which is the x-component of the center
+    #  @param cy A real number which is the y-component of the center
+    #  @param r A real number which is the radius
+    #  @returns A BodyT of the point masses in the closed disc
+    #  @throws ValueError if there are no point masses in it
+    def circle(self, cx, cy, r):
+        return self.__body__(self.__walk__(self.__circle__, [[cx], [cy], [r]], 1))
+
+    ## @brief The point masses inside each of many rectangles
+    #  @param x0_s An array-like of real numbers which are the left sides
+    #  @param y0_s An array-like of real numbers which are the bottom sides
+    #  @param x1_s An array-like of real numbers which are the right sides
+    #  @param y1_s An array-like of real numbers which are the top sides
+    #  @returns A tuple of arrays (mass, cm_x, cm_y, moment) with one entry
+    #           per rectangle, where the center of mass and moment of an
+    #           empty rectangle are nan
+    def rects(self, x0_s, y0_s, x1_s, y1_s):
+        return self.__props__(self.__walk__(self.__rect__, [x0_s, y0_s, x1_s, y1_s], 2))
+
+    ## @brief The point masses inside each of many circles
+    #  @param cx_s An array-like of real numbers which are the x-components
+    #              of the centers
+    #  @param cy_s An array-like of real numbers which are the y-components
+    #              of the centers
+    #  @param r_s An array-like of real numbers which are the radii
+    #  @returns A tuple of arrays (mass, cm_x, cm_y, moment) with one entry
+    #           per circle, where the center of mass and moment of an empty
+    #           circle are nan
+    def circles(self, cx_s, cy_s, r_s):
+        return self.__props__(self.__walk__(self.__circle__, [cx_s, cy_s, r_s], 1))
+
+    ## @brief helper method to summarize the nodes of a level
+    #  @param start An array of the start of each node's points
+    #  @param end An array of the end of each node's points
+    #  @param leaf_size A natural number which is the largest leaf
+    #  @return A dictionary of the 'start' and 'end' of each node, its
+    #          'sums' m, m x, m y and m (x^2 + y^2), its bounding box
+    #          'box' x_min, x_max, y_min, y_max, whether its box is
+    #          'wide_x' and whether it is a 'leaf'. The index of the
+    #          'first' child of each node is added once the next level is
+    #          built.
+    def __level__(self, start, end, leaf_size):
+        x = self.x
+        y = self.y
+        m = self.m
+        bounds = np.stack([start, end], axis=1).ravel()
+        sums = np.stack([self.__node_reduce__(np.add, z, bounds) for z in
+                         (m, m * x, m * y, m * (x * x + y * y))])
+        box = np.stack([self.__node_reduce__(f, z, bounds) for z in (x, y)
+                        for f in (np.minimum, np.maximum)])
+        return {'start': start, 'end': end, 'sums': sums, 'box': box,
+                'wide_x': box[1] - box[0] >= box[3] - box[2],
+                'leaf': end - start <= leaf_size}
+
+    ## @brief helper method to reduce each node's points
+    #  @details The nodes of a level needn't be contiguous, as the points
+    #           of earlier leaves lie between them, so the reduction runs
+    #           over the interleaved starts and ends and only every other
+    #           result is kept
+    #  @param f A NumPy ufunc which is the reduction
+    #  @param z An array with a value per point
+    #  @param bounds An array of the start and end of each node, interleaved
+    #  @return An array with the reduction of the values of each node
+    @staticmethod
+    def __node_reduce__(f, z, bounds):
+        return f.reduceat(np.append(z, 0), bounds)[::2]
+
+    ## @brief helper method to sort the points of nodes for splitting
+    #  @details Sorts the points of each node along its longer side, in
+    #           place, so its two halves are its children
+    #  @param start An array of the start of each node's points
+    #  @param end An array of the end of each node's points
+    #  @param wide_x An array of booleans, true to split a node along x
+    def __split__(self, start, end, wide_x):
+        node = np.repeat(np.arange(len(start)), end - start)
+        idx = Ranges.ranges(start, end)
+        along = np.where(wide_x[node], self.x[idx], self.y[idx])
+        order = idx[np.lexsort((along, node))]
+        self.x[idx] = self.x[order]
+        self.y[idx] = self.y[order]
+        self.m[idx] = self.m[order]
+
+    ## @brief helper method to walk the tree for a batch of queries
+    #  @param classify A function of the query indices, node boxes and
+    #         points of the frontier which tells which nodes are inside
+    #         and outside each query region and which points are inside
+    #  @param params A list of the array-likes of the parameters of the
+    #         queries, starting with points (x, y)
+    #  @param npts A natural number which is the number of points (x, y)
+    #         at the start of params, which are moved to the tree's origin
+    #  @return A (4, Q) array of the sums m, m x, m y and m (x^2 + y^2)
+    #          of the points inside each query, relative to the origin
+    #          of the tree
+    def __walk__(self, classify, params, npts):
+        q = [np.asarray(p, dtype=np.float64).reshape(-1) for p in params]
+        for k in range(npts):
+            q[2 * k] = q[2 * k] - self.ox
+            q[2 * k + 1] = q[2 * k + 1] - self.oy
+        n = len(q[0])
+        total = np.zeros((4, n))
+        pq = np.arange(n)
+        pn = np.zeros(n, dtype=np.intp)
+        self.visited = 0
+        for level in self.levels:
+            if len(pq) == 0:
+                break
+            self.visited += len(pq)
+            inside, outside = classify([p[pq] for p in q], level['box'][:, pn])
+            for k in range(4):
+                total[k] += np.bincount(pq[inside], weights=level['sums'][k, pn[inside]],
+                                        minlength=n)
+
+            cross = ~(inside | outside)
+            leaf = cross & level['leaf'][pn]
+            owner, pt = Ranges.expand(pq[leaf], level['start'][pn[leaf]],
+                                      level['end'][pn[leaf]])
+            self.visited += len(pt)
+            x = self.x[pt]
+            y = self.y[pt]
+            hit = classify([p[owner] for p in q], np.stack([x, x, y, y]))[0]
+            m = self.m[pt[hit]]
+            x = x[hit]
+            y = y[hit]
+            for k, z in enumerate((m, m * x, m * y, m * (x * x + y * y))):
+                total[k] += np.bincount(owner[hit], weights=z, minlength=n)
+
+            down = cross & ~level['leaf'][pn]
+            pq = np.repeat(pq[down], 2)
+            pn = np.repeat(level['first'][pn[down]], 2) + np.tile([0, 1], int(down.sum()))
+        return total
+
+    ## @brief helper method to classify boxes against rectangles
+    #  @param q A list of the arrays x0, y0, x1, y1 of the rectangles
+    #  @param box A (4, K) array of the boxes x_min, x_max, y_min, y_max
+    #  @return A pair of boolean arrays, true where the box is inside and
+    #          where it is outside the rectangle
+    @staticmethod
+    def __rect__(q, box):
+        x0, y0, x1, y1 = q
+        inside = (box[0] >= x0) & (box[1] <= x1) & (box[2] >= y0) & (box[3] <= y1)
+        outside = (box[1] < x0) | (box[0] > x1) | (box[3] < y0) | (box[2] > y1)
+        return inside, outside
+
+    ## @brief helper method to classify boxes against circles
+    #  @param q A list of the arrays cx, cy, r of the circles
+    #  @param box A (4, K) array of the boxes x_min, x_max, y_min, y_max
+    #  @return A pair of boolean arrays, true where the box is inside and
+    #          where it is outside the circle
+    @staticmethod
+    def __circle__(q, box):
+        cx, cy, r = q
+        near_x = np.maximum(np.maximum(box[0] - cx, cx - box[1]), 0)
+        near_y = np.maximum(np.maximum(box[2] - cy, cy - box[3]), 0)
+        far_x = np.maximum(np.abs(box[0] - cx), np.abs(box[1] - cx))
+        far_y = np.maximum(np.abs(box[2] - cy), np.abs(box[3] - cy))
+        inside = far_x * far_x + far_y * far_y <= r * r
+        outside = near_x * near_x + near_y * near_y > r * r
+        return inside, outside
+
+    ## @brief helper method to make a body of the sums of one query
+    #  @param total A (4, 1) array of the sums of the query
+    #  @return A BodyT with those sums, moved back from the tree's origin
+    #  @throws ValueError if the query holds no points
+    def __body__(self, total):
+        m, cx, cy, moment = (float(v[0]) for v in self.__props__(total))
+        if not(m > 0):
+            raise ValueError
+        return BodyT.from_moments(m, cx, cy, moment)
+
+    ## @brief helper method to find the properties of the sums of queries
+    #  @param total A (4, Q) array of the sums of each query
+    #  @return A tuple of arrays (mass, cm_x, cm_y, moment), moved back
+    #          from the tree's origin
+    def __props__(self, total):
+        m, mx, my, mr2 = total
+        with np.errstate(divide='ignore', invalid='ignore'):
+            cx = mx / m
+            cy = my / m
+            moment = mr2 - m * (cx * cx + cy * cy)
+        return m, cx + self.ox, cy + self.oy, moment
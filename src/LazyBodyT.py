@@ -0,0 +1,305 @@
+## @file LazyBodyT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which specifies a lazily evaluated body
+#         (a collection of point masses which are retained)
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+from BodyT import BodyT
+from KdTreeT import KdTreeT
+from MomentAccumT import MomentAccumT
+
+## @brief Defines a lazy body ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends BodyT. Construction only stores read-only references
+#           to the point arrays, and the mass, center of mass and moment
+#           of inertia are each computed on first access and cached. The
+#           arrays passed in must not be modified afterwards.
+
+
+class LazyBodyT(BodyT):
+    __slots__ = ('pts', 'kd', 'lods', 'robust')
+
+    ## @brief Constructor for LazyBodyT
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @param robust A boolean, true to compute the center of mass and
+    #                moment of inertia with a MomentAccumT, which stays
+    #                accurate for points far from the origin
+    #  @throws ValueError if the arrays x_s, y_s and m_s aren't the
+    #          same length
+    def __init__(self, x_s, y_s, m_s, robust=False):
+        x = self.__view__(x_s)
+        y = self.__view__(y_s)
+        m = self.__view__(m_s)
+        if not(x.shape == y.shape and y.shape == m.shape and x.ndim == 1):
+            raise ValueError
+
+        self.pts = (x, y, m)
+        self.kd = None
+        self.lods = {}
+        self.robust = robust
+        self.cmx = None
+        self.cmy = None
+        self.m = None
+        self.moment = None
+
+    ## @brief Constructs a lazy body from NumPy arrays or any buffer
+    #  @details The arrays are kept as they are, so nothing is reduced
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @param workers Unused, as there is nothing to reduce
+    #  @param robust A boolean, passed on to the constructor
+    #  @param keep_points Unused, as a lazy body always keeps them
+    #  @returns A LazyBodyT of the point masses
+    #  @throws ValueError under the same conditions as the constructor
+    @classmethod
+    def from_arrays(cls, x_s, y_s, m_s, workers=1, robust=False, keep_points=False):
+        return cls(x_s, y_s, m_s, robust=robust)
+
+    ## @brief Constructs a lazy body by streaming point masses from an
+    #         iterable
+    #  @details The point masses are gathered into arrays, since a lazy
+    #           body keeps them
+    #  @param items An iterable of (x, y, m) triples, where each of x, y
+    #               and m is either a real number or an equal-length
+    #               array-like chunk of real numbers
+    #  @param robust A boolean, passed on to the constructor
+    #  @returns A LazyBodyT of all the streamed point masses
+    #  @throws ValueError if no point masses are streamed, or if the
+    #          chunks of a triple aren't the same length
+    @classmethod
+    def from_iter(cls, items, robust=False):
+        chunks = [[], [], []]
+        for triple in items:
+            zs = [np.atleast_1d(np.asarray(z, dtype=np.float64)) for z in triple]
+            if not(zs[0].shape == zs[1].shape and zs[1].shape == zs[2].shape):
+                raise ValueError
+            for chunk, z in zip(chunks, zs):
+                chunk.append(z)
+
+        return cls(*(np.concatenate(chunk) for chunk in chunks), robust=robust)
+
+    ## @brief Constructs a body from the sums of its point masses
+    #  @details Sums don't give the point masses a lazy body keeps, so the
+    #           body is a plain BodyT
+    #  @param m A real number which is the total mass of the points
+    #  @param mx A real number which is the sum of m * x over the points
+    #  @param my A real number which is the sum of m * y over the points
+    #  @param mr2 A real number which is the sum of m * (x^2 + y^2)
+    #             over the points
+    #  @returns A BodyT with the given sums
+    #  @throws ValueError if the total mass is not greater than zero
+    @classmethod
+    def from_sums(cls, m, mx, my, mr2):
+        return BodyT.from_sums(m, mx, my, mr2)
+
+    ## @brief Constructs a body from its mass, center of mass and moment
+    #  @details Moments don't give the point masses a lazy body keeps, so
+    #           the body is a plain BodyT
+    #  @param m A real number which is the total mass of the points
+    #  @param cm_x A real number which is the x-component of the center
+    #              of mass
+    #  @param cm_y A real number which is the y-component of the center
+    #              of mass
+    #  @param moment A real number which is the moment of inertia about
+    #                the center of mass
+    #  @returns A BodyT with the given moments
+    #  @throws ValueError if the total mass is not greater than zero
+    @classmethod
+    def from_moments(cls, m, cm_x, cm_y, moment):
+        return BodyT.from_moments(m, cm_x, cm_y, moment)
+
+    ## @brief Getter for the point masses of the body
+    #  @returns A tuple (x, y, m) of read-only arrays which are the
+    #           positions and masses of the point masses
+    def points(self):
+        return self.pts
+
+    ## @brief Getter for a spatial index of the point masses
+    #  @details The index is built on first use and kept, so it answers
+    #           region queries on the body's points in time logarithmic in
+    #           their number
+    #  @param leaf_size A natural number which is the largest number of
+    #         points in a leaf of a new index
+    #  @returns A KdTreeT of the point masses of the body
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def index(self, leaf_size=16):
+        if self.kd is None:
+            self.kd = KdTreeT(*self.pts, leaf_size=leaf_size)
+        return self.kd
+
+    ## @brief Clusters the point masses into at most k point masses
+    #  @details The points are binned into a grid of quantiles, about
+    #           sqrt(k) columns of equal count in x, each cut into rows of
+    #           equal count in y, and each bin is replaced by a point of
+    #           its total mass at its center of mass. This keeps the mass
+    #           and center of mass, and the offsets of the new points from
+    #           the center of mass are then scaled so the moment of
+    #           inertia is kept as well. Each level of detail is cached,
+    #           and new ones are coarsened from the smallest cached level
+    #           which has more than k points.
+    #  @param k A natural number which is the largest number of points
+    #  @returns A LazyBodyT of at most k point masses with the same mass,
+    #           center of mass and moment of inertia as the body, or the
+    #           body itself if it has at most k points
+    #  @throws ValueError if k is less than 1, or is 1 and the moment of
+    #          inertia is not zero, or if there are no points or any of
+    #          the masses is not greater than zero
+    def coarsen(self, k):
+        if len(self.pts[2]) <= k:
+            self.mass()
+            return self
+        if k not in self.lods:
+            finer = [b for b in self.lods.values() if len(b.pts[2]) > k]
+            src = min(finer, key=lambda b: len(b.pts[2]), default=self)
+            self.lods[k] = src.__bin__(k)
+        return self.lods[k]
+
+    ## @brief Getter for the cached levels of detail
+    #  @returns A dictionary from each k passed to coarsen to the
+    #           LazyBodyT it returned
+    def get_lods(self):
+        return self.lods
+
+    ## @brief Getter for x-component of center of mass
+    #  @returns A real number which is the x-component
+    #           of the body's center of mass
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def cm_x(self):
+        if self.cmx is None:
+            self.__cm__()
+        return self.cmx
+
+    ## @brief Getter for y-component of center of mass
+    #  @returns A real number which is the y-component
+    #           of the body's center of mass
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def cm_y(self):
+        if self.cmy is None:
+            self.__cm__()
+        return self.cmy
+
+    ## @brief Getter for mass of body
+    #  @returns A real number which is the mass of the body
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def mass(self):
+        if self.m is None:
+            m = self.pts[2]
+            if m.size == 0 or not np.all(m > 0):
+                raise ValueError
+            self.m = float(m.sum())
+        return self.m
+
+    ## @brief Getter for moment of inertia of the body
+    #  @returns A real number which is the moment of inertia of the body
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def m_inert(self):
+        if self.moment is None and self.robust:
+            self.__robust__()
+        if self.moment is None:
+            x, y, m = self.pts
+            mr2 = float(np.dot(m, x * x) + np.dot(m, y * y))
+            self.moment = mr2 - self.mass() * (self.cm_x()**2 + self.cm_y()**2)
+        return self.moment
+
+    ## @brief Getter for the radius of the body
+    #  @returns A real number which is the largest distance from the
+    #           center of mass to any of the point masses
+    #  @throws ValueError if there are no points or if any of the
+    #          masses is not greater than zero
+    def radius(self):
+        x, y, m = self.pts
+        return float(np.sqrt(np.max((x - self.cm_x())**2 + (y - self.cm_y())**2)))
+
+    ## @brief helper method to bin the point masses into at most k points
+    #  @param k A natural number less than the number of points
+    #  @return A LazyBodyT of the scaled centers of mass of the bins
+    #  @throws ValueError if k is less than 1, or is 1 and the moment of
+    #          inertia is not zero
+    def __bin__(self, k):
+        x, y, m = self.pts
+        n = len(m)
+        if k < 2:
+            return self.ring(k)
+        cols = int(np.sqrt(k))
+        rows = k // cols
+        col = np.empty(n, dtype=np.intp)
+        col[np.argsort(x, kind='stable')] = np.arange(n) * cols // n
+        order = np.lexsort((y, col))
+        count = np.bincount(col, minlength=cols)
+        rank = np.arange(n) - np.repeat(np.cumsum(count) - count, count)
+        cell = np.empty(n, dtype=np.intp)
+        cell[order] = col[order] * rows + rank * rows // count[col[order]]
+
+        mass = np.bincount(cell, weights=m, minlength=cols * rows)
+        full = mass > 0
+        mass = mass[full]
+        dx = np.bincount(cell, weights=m * (x - self.cm_x()))[full] / mass
+        dy = np.bincount(cell, weights=m * (y - self.cm_y()))[full] / mass
+        coarse = float(np.dot(mass, dx * dx + dy * dy))
+        if not(coarse > 0):
+            return self.ring(k)
+        scale = np.sqrt(max(self.m_inert(), 0) / coarse)
+        return LazyBodyT(self.cm_x() + scale * dx, self.cm_y() + scale * dy, mass,
+                         robust=self.robust)
+
+    ## @brief helper method to compute and cache the center of mass
+    def __cm__(self):
+        if self.robust:
+            self.__robust__()
+            return
+        x, y, m = self.pts
+        mass = self.mass()
+        self.cmx = float(np.dot(m, x)) / mass
+        self.cmy = float(np.dot(m, y)) / mass
+
+    ## @brief helper method to compute and cache the center of mass and
+    #         moment of inertia with a MomentAccumT
+    def __robust__(self):
+        acc = MomentAccumT()
+        acc.add_chunk(*self.pts)
+        self.m, self.cmx, self.cmy, self.moment = acc.moments()
+
+    ## @brief helper method to keep the columns of a mapped (N, 3) array
+    #  @details The columns stay views of the mapped buffer, so the file
+    #           is still never loaded into memory
+    #  @param a An (N, 3) array whose rows are the (x, y, m) of each point
+    #  @param chunk Unused, as there is nothing to reduce
+    #  @param robust A boolean, passed on to the constructor
+    #  @returns A LazyBodyT of all the point masses in the array
+    #  @throws ValueError if the array isn't (N, 3)
+    @classmethod
+    def __from_mapped__(cls, a, chunk, robust=False):
+        if not(a.ndim == 2 and a.shape[1] == 3):
+            raise ValueError
+
+        return cls(a[:, 0], a[:, 1], a[:, 2], robust=robust)
+
+    ## @brief helper method to make a read-only view of an array
+    #  @param z An array-like of real numbers
+    #  @return A read-only float64 array, sharing memory with z
+    #          whenever z already is a float64 array
+    def __view__(self, z):
+        v = np.asarray(z, dtype=np.float64).view()
+        v.flags.writeable = False
+        return v
+
+    ## @brief helper method to collect the state variables of the body
+    #  @return A tuple of the derived quantities of the body
+    def __key__(self):
+        return (self.cm_x(), self.cm_y(), self.mass(), self.m_inert())
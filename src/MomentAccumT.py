@@ -0,0 +1,160 @@
+## @file MomentAccumT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which accumulates the moments of a body robustly
+#  @date Oct. 17, 2026
+
+import math
+
+import numpy as np
+
+## @brief The unit roundoff of float64
+__EPS__ = np.finfo(np.float64).eps / 2
+
+## @brief Defines a robust moment accumulator ADT. Assumption: Assume all
+#         inputs provided to methods are of the correct type
+#  @details Has the same interface as BodyAccumT, but instead of the raw
+#           sums keeps the total mass, the center of mass, and the sum
+#           S of m * |r - cm|^2 about the center of mass, which is the
+#           moment of inertia. The center of mass is kept as an offset
+#           from a shifted origin, the first center seen, so the small
+#           differences between centers aren't rounded away. Chunks are
+#           reduced with the corrected two-pass algorithm about their own
+#           mean, and partial results are combined with the weighted merge
+#           of Chan et al., so the moment never comes from subtracting two
+#           large sums and stays accurate for bodies far from the origin.
+#           A running estimate of the absolute error of the moment is kept
+#           alongside.
+
+
+class MomentAccumT:
+    ## @brief The number of points reduced at a time by add_chunk
+    BLOCK = 1 << 14
+
+    ## @brief Constructor for MomentAccumT
+    #  @details The accumulator starts empty
+    def __init__(self):
+        self.n = 0
+        self.m = 0.0
+        self.ox = 0.0
+        self.oy = 0.0
+        self.cx = 0.0
+        self.cy = 0.0
+        self.s = 0.0
+        self.err = 0.0
+
+    ## @brief Adds a single point mass to the accumulator
+    #  @param x A real number which is the x-component of the point mass
+    #  @param y A real number which is the y-component of the point mass
+    #  @param m A real number which is the mass of the point mass
+    #  @param inert A real number which is the moment of inertia of the
+    #               point mass about its own position
+    #  @throws ValueError if the mass is not greater than zero
+    def add(self, x, y, m, inert=0):
+        if not(m > 0):
+            raise ValueError
+
+        self.__combine__(1, float(m), (float(x), float(y)), 0.0, 0.0, float(inert), 0.0)
+
+    ## @brief Adds a chunk of point masses using vectorized reductions
+    #  @details The chunk is reduced in blocks of BLOCK points, so the
+    #           temporaries of both passes over a block stay in cache
+    #  @param x_s An array-like of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s An array-like of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s An array-like of real numbers which
+    #             are the mass of each point mass
+    #  @throws ValueError if the chunks aren't the same length or if
+    #          any of the masses is not greater than zero
+    def add_chunk(self, x_s, y_s, m_s):
+        x = np.asarray(x_s, dtype=np.float64).reshape(-1)
+        y = np.asarray(y_s, dtype=np.float64).reshape(-1)
+        m = np.asarray(m_s, dtype=np.float64).reshape(-1)
+        if not(x.shape == y.shape and y.shape == m.shape):
+            raise ValueError
+        if not np.all(m > 0):
+            raise ValueError
+
+        for i in range(0, m.size, self.BLOCK):
+            j = i + self.BLOCK
+            self.__block__(x[i:j], y[i:j], m[i:j])
+
+    ## @brief Merges the moments of another accumulator into this one
+    #  @param other A MomentAccumT whose point masses are to be added
+    def merge(self, other):
+        if other.n > 0:
+            self.__combine__(other.n, other.m, (other.ox, other.oy), other.cx, other.cy,
+                             other.s, other.err)
+
+    ## @brief Getter for the number of point masses added so far
+    #  @returns A natural number which is the number of point masses
+    def count(self):
+        return self.n
+
+    ## @brief Getter for the accumulated moments
+    #  @returns The total mass, the x and y components of the center of
+    #           mass and the moment of inertia of the point masses
+    #  @throws ValueError if no point masses have been added
+    def moments(self):
+        if self.n == 0:
+            raise ValueError
+
+        return self.m, self.ox + self.cx, self.oy + self.cy, self.s
+
+    ## @brief Getter for the estimated error of the moment of inertia
+    #  @details Bounds the rounding in each chunk's sum about its center
+    #           and in each merge, to first order in the unit roundoff
+    #  @returns A real number which is an estimate of the absolute error
+    #           of the accumulated moment of inertia
+    def error(self):
+        return self.err
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another accumulator to test for equality
+    #  @returns A boolean, true iff both objects have the same state variables
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
+
+    ## @brief helper method to add a block of point masses
+    #  @details The block's center of mass is refined by one correction
+    #           step, and its moment is summed about it with the
+    #           corrected two-pass algorithm
+    #  @param x A non-empty float64 array of the x-coords of the points
+    #  @param y A float64 array of the y-coords of the points
+    #  @param m A float64 array of the masses of the points
+    def __block__(self, x, y, m):
+        w = float(m.sum())
+        origin = (float(np.dot(m, x)) / w, float(np.dot(m, y)) / w)
+        dx = x - origin[0]
+        dy = y - origin[1]
+        sdx = float(np.dot(m, dx))
+        sdy = float(np.dot(m, dy))
+        s = float(np.dot(m, dx * dx) + np.dot(m, dy * dy)) - (sdx * sdx + sdy * sdy) / w
+        s = max(s, 0.0)
+        err = __EPS__ * (math.log2(m.size) + 4) * s
+        self.__combine__(m.size, w, origin, sdx / w, sdy / w, s, err)
+
+    ## @brief helper method to merge a partial result into the accumulator
+    #  @param n A natural number which is the number of point masses
+    #  @param m A real number which is their total mass
+    #  @param origin A pair of real numbers which is the origin their cm
+    #         is measured from
+    #  @param cx A real number which is the x-component of their cm,
+    #            relative to the origin
+    #  @param cy A real number which is the y-component of their cm,
+    #            relative to the origin
+    #  @param s A real number which is their moment about their cm
+    #  @param err A real number which is the estimated error of s
+    def __combine__(self, n, m, origin, cx, cy, s, err):
+        if self.n == 0:
+            self.ox, self.oy = origin
+        total = self.m + m
+        dx = (origin[0] - self.ox) + cx - self.cx
+        dy = (origin[1] - self.oy) + cy - self.cy
+        shift = (dx * dx + dy * dy) * (self.m * m / total)
+        self.cx += dx * (m / total)
+        self.cy += dy * (m / total)
+        self.s += s + shift
+        self.err += err + 4 * __EPS__ * self.s
+        self.m = total
+        self.n += n
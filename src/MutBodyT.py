@@ -0,0 +1,118 @@
+## @file MutBodyT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which specifies a mutable body
+#         (an editable collection of point masses)
+#  @date Oct. 17, 2026
+
+from Shape import Shape
+from BodyAccumT import BodyAccumT
+
+## @brief Defines a mutable body ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the Shape interface. Point masses can be added,
+#           removed and moved one at a time, and the mass, center of
+#           mass and moment of inertia are updated in constant time
+#           from running sums. Removing floating point masses may leave
+#           a small rounding drift in the sums; integer inputs are exact.
+
+
+class MutBodyT(Shape):
+    ## @brief Constructor for MutBodyT
+    #  @param x_s A sequence of real numbers which
+    #             are the x-component of each point mass
+    #  @param y_s A sequence of real numbers which
+    #             are the y-component of each point mass
+    #  @param m_s A sequence of real numbers which
+    #             are the mass of each point mass
+    #  @throws ValueError if any mass is not greater than zero,
+    #          or if the sequences x_s, y_s and m_s aren't the same length
+    def __init__(self, x_s=(), y_s=(), m_s=()):
+        if not(len(x_s) == len(y_s) and len(y_s) == len(m_s)):
+            raise ValueError
+
+        self.pts = {}
+        self.next_id = 0
+        self.acc = BodyAccumT()
+        for x, y, m in zip(x_s, y_s, m_s):
+            self.add_point(x, y, m)
+
+    ## @brief Adds a point mass to the body
+    #  @param x A real number which is the x-component of the point mass
+    #  @param y A real number which is the y-component of the point mass
+    #  @param m A real number which is the mass of the point mass
+    #  @returns A natural number which identifies the new point mass
+    #  @throws ValueError if the mass is not greater than zero
+    def add_point(self, x, y, m):
+        self.acc.add(x, y, m)
+
+        i = self.next_id
+        self.pts[i] = (x, y, m)
+        self.next_id += 1
+        return i
+
+    ## @brief Removes a point mass from the body
+    #  @param i A natural number which identifies the point mass
+    #  @throws KeyError if there is no point mass identified by i
+    def remove_point(self, i):
+        x, y, m = self.pts.pop(i)
+        self.acc.remove(x, y, m)
+
+    ## @brief Moves a point mass of the body to a new position
+    #  @param i A natural number which identifies the point mass
+    #  @param x A real number which is the new x-component of the point mass
+    #  @param y A real number which is the new y-component of the point mass
+    #  @throws KeyError if there is no point mass identified by i
+    def move_point(self, i, x, y):
+        old_x, old_y, m = self.pts[i]
+        self.acc.remove(old_x, old_y, m)
+        self.acc.add(x, y, m)
+        self.pts[i] = (x, y, m)
+
+    ## @brief Getter for a point mass of the body
+    #  @param i A natural number which identifies the point mass
+    #  @returns A tuple (x, y, m) which is the position and mass of the point
+    #  @throws KeyError if there is no point mass identified by i
+    def get_point(self, i):
+        return self.pts[i]
+
+    ## @brief Getter for the number of point masses in the body
+    #  @returns A natural number which is the number of point masses
+    def __len__(self):
+        return len(self.pts)
+
+    ## @brief Getter for x-component of center of mass
+    #  @returns A real number which is the x-component
+    #           of the body's center of mass
+    #  @throws ValueError if the body has no point masses
+    def cm_x(self):
+        m, mx, my, mr2 = self.acc.sums()
+        return mx / m
+
+    ## @brief Getter for y-component of center of mass
+    #  @returns A real number which is the y-component
+    #           of the body's center of mass
+    #  @throws ValueError if the body has no point masses
+    def cm_y(self):
+        m, mx, my, mr2 = self.acc.sums()
+        return my / m
+
+    ## @brief Getter for mass of body
+    #  @returns A real number which is the mass of the body
+    #  @throws ValueError if the body has no point masses
+    def mass(self):
+        return self.acc.sums()[0]
+
+    ## @brief Getter for moment of inertia of the body
+    #  @returns A real number which is the moment of inertia of the body
+    #  @throws ValueError if the body has no point masses
+    def m_inert(self):
+        m, mx, my, mr2 = self.acc.sums()
+        cm_x = mx / m
+        cm_y = my / m
+        return mr2 - m * (cm_x**2 + cm_y**2)
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another shape to test for equality
+    #  @returns A boolean, true iff both objects have the same state variables
+    def __eq__(self, other):
+        return self.__dict__ == other.__dict__
@@ -0,0 +1,376 @@
+## @file NBodyScene.py
+#  @author Mihail Serafimovski
+#  @brief Defines a multi-body scene module
+#  @details The multi-body scene module simulates many shapes which
+#   attract each other by gravitation, with the mutual forces computed by
+#   the Barnes-Hut method
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+import Ranges
+from SpatialHashT import SpatialHashT
+
+## @brief Defines the multi-body scene module
+#  @details Each shape is reduced to its mass and center of mass. The
+#   Barnes-Hut quadtree is built level by level from the Morton codes of
+#   the sorted positions, and is walked for all bodies at once: at each
+#   level, every (body, cell) pair of the frontier is either accepted, if
+#   the cell is far enough away, summed directly, if it is a leaf, or
+#   replaced by the cell's children. The motion is integrated with the
+#   kick-drift-kick leapfrog method.
+
+
+class NBodyScene:
+    ## @brief The number of bits of each coordinate in the Morton codes,
+    #         which is the depth of the quadtree
+    DEPTH = 16
+
+    ## @brief The number of bodies whose tree walks are done at a time
+    BATCH = 1 << 14
+
+    ## @brief Constructor for NBodyScene
+    #  @param shapes A sequence of N shapes whose motion is to be simulated
+    #  @param v_x A real number, or a sequence of N real numbers, which is
+    #         the initial velocity in the x-dir of each shape
+    #  @param v_y A real number, or a sequence of N real numbers, which is
+    #         the initial velocity in the y-dir of each shape
+    #  @param G A real number which is the gravitational constant
+    #  @param theta A real number which is the opening angle; a cell of
+    #         width s at distance d is treated as a point mass if
+    #         s < theta * d, and 0 makes every force a direct sum
+    #  @param softening A real number which is the softening length added
+    #         to every distance, to keep close encounters finite
+    #  @param leaf_size A natural number which is the largest number of
+    #         bodies in a cell which is summed directly
+    #  @throws ValueError if there are no shapes, if v_x or v_y don't have
+    #          one value per shape, or if theta or softening is negative
+    def __init__(self, shapes, v_x, v_y, G=1.0, theta=0.5, softening=1e-3,
+                 leaf_size=8):
+        x = [s.cm_x() for s in shapes]
+        y = [s.cm_y() for s in shapes]
+        m = [s.mass() for s in shapes]
+        r = [s.radius() for s in shapes]
+        self.__set_state__(x, y, m, v_x, v_y, r, G, theta, softening, leaf_size)
+
+    ## @brief Constructs a multi-body scene from arrays of point masses
+    #  @param x_s An array-like of N real numbers which are the x-component
+    #             of each body
+    #  @param y_s An array-like of N real numbers which are the y-component
+    #             of each body
+    #  @param m_s An array-like of N real numbers which are the masses
+    #  @param v_x A real number or an array-like of N initial x-velocities
+    #  @param v_y A real number or an array-like of N initial y-velocities
+    #  @param r_s A real number or an array-like of N real numbers which
+    #         are the radii of the bodies, used to detect contacts
+    #  @param kwargs The G, theta, softening and leaf_size of the scene
+    #  @returns An NBodyScene of the bodies
+    #  @throws ValueError if the arrays don't all have N values
+    @classmethod
+    def from_arrays(cls, x_s, y_s, m_s, v_x, v_y, r_s=0, **kwargs):
+        scene = cls.__new__(cls)
+        scene.__set_state__(x_s, y_s, m_s, v_x, v_y, r_s, **kwargs)
+        return scene
+
+    ## @brief Getter for the number of bodies in the scene
+    #  @returns A natural number which is the number of bodies
+    def __len__(self):
+        return len(self.m)
+
+    ## @brief Getter for the current state of the bodies
+    #  @returns An (N, 4) array with the x, y, v_x, v_y of each body
+    def get_state(self):
+        return np.stack([self.x, self.y, self.v_x, self.v_y], axis=1)
+
+    ## @brief Getter for the masses of the bodies
+    #  @returns An array of N real numbers which are the masses
+    def get_masses(self):
+        return self.m
+
+    ## @brief Getter for the radii of the bodies
+    #  @returns An array of N real numbers which are the radii
+    def get_radii(self):
+        return self.r
+
+    ## @brief Finds the bodies which are in contact
+    #  @details Bodies are discs of their radius about their center of
+    #           mass, so triangles are bounded by their circumcircle. The
+    #           spatial hash of the bodies is kept between calls and only
+    #           re-buckets the bodies whose cell changed.
+    #  @returns A pair of arrays (i, j) with i < j, sorted, one entry per
+    #           pair of overlapping bodies
+    def contacts(self):
+        if self.grid is None:
+            self.grid = SpatialHashT(self.x, self.y, self.r)
+        else:
+            self.grid.update(self.x, self.y)
+        return self.grid.pairs()
+
+    ## @brief Computes the gravitational accelerations with Barnes-Hut
+    #  @returns A pair of arrays of N real numbers which are the x and y
+    #           accelerations of each body
+    def accel(self):
+        return self.__accel__(self.x, self.y)
+
+    ## @brief Computes the gravitational accelerations by direct sums
+    #  @details Takes time quadratic in N. This is the reference which
+    #           the Barnes-Hut accelerations approximate.
+    #  @returns A pair of arrays of N real numbers which are the x and y
+    #           accelerations of each body
+    def accel_direct(self):
+        n = len(self)
+        ax = np.empty(n)
+        ay = np.empty(n)
+        step = max(1, (1 << 22) // n)
+        idx = np.arange(n)
+        for lo in range(0, n, step):
+            i = idx[lo:lo + step]
+            dx = self.x[np.newaxis, :] - self.x[i, np.newaxis]
+            dy = self.y[np.newaxis, :] - self.y[i, np.newaxis]
+            w = self.__kernel__(dx, dy, self.m[np.newaxis, :])
+            w[np.arange(len(i)), i] = 0
+            ax[i] = (w * dx).sum(axis=1)
+            ay[i] = (w * dy).sum(axis=1)
+        return ax, ay
+
+    ## @brief Advances the bodies in time
+    #  @details Takes kick-drift-kick leapfrog steps, which keep the
+    #           energy of the system bounded over long runs
+    #  @param dt A real number which is the length of each step
+    #  @param n A natural number which is the number of steps
+    def step(self, dt, n=1):
+        ax, ay = self.accel()
+        for _ in range(n):
+            ax, ay = self.__leapfrog__(dt, ax, ay)
+
+    ## @brief Simulates motion of the bodies in the scene
+    #  @details Advances the bodies from their current state, one leapfrog
+    #           step per time step
+    #  @param t_final A real number which specifies the amount
+    #         of time the simulation should run for
+    #  @param nsteps A natural number which specifies how many
+    #         steps of time there should be in the simulation
+    #  @param contacts A boolean, true to detect contacts at every time step
+    #         and return the contact events as a third value
+    #  @returns An array of real numbers representing the time steps and
+    #           an (N, nsteps, 4) array with the x, y, v_x, v_y of each
+    #           body at each time step. With contacts, also an (M, 3)
+    #           array of integers with a row (k, i, j) for each pair of
+    #           bodies i < j which come into contact at time step k.
+    def sim(self, t_final, nsteps, contacts=False):
+        t = np.arange(nsteps) * t_final / (nsteps - 1)
+        w = np.empty((len(self), nsteps, 4))
+        w[:, 0] = self.get_state()
+        events = [self.__events__(0, np.empty(0, dtype=np.int64))] if contacts else []
+        ax, ay = self.accel()
+        for k in range(1, nsteps):
+            ax, ay = self.__leapfrog__(t[k] - t[k - 1], ax, ay)
+            w[:, k, 0] = self.x
+            w[:, k, 1] = self.y
+            w[:, k, 2] = self.v_x
+            w[:, k, 3] = self.v_y
+            if contacts:
+                events.append(self.__events__(k, events[-1][1]))
+        if contacts:
+            return t, w, np.concatenate([e[0] for e in events])
+        return t, w
+
+    ## @brief helper method to set the state of the scene
+    #  @param x_s The x-components of the bodies
+    #  @param y_s The y-components of the bodies
+    #  @param m_s The masses of the bodies
+    #  @param v_x The initial x-velocities, one or per body
+    #  @param v_y The initial y-velocities, one or per body
+    #  @param r_s The radii of the bodies, one or per body
+    #  @param G A real number which is the gravitational constant
+    #  @param theta A real number which is the opening angle
+    #  @param softening A real number which is the softening length
+    #  @param leaf_size A natural number which is the largest leaf
+    #  @throws ValueError if the inputs are inconsistent
+    def __set_state__(self, x_s, y_s, m_s, v_x, v_y, r_s, G=1.0, theta=0.5,
+                      softening=1e-3, leaf_size=8):
+        self.x = np.array(x_s, dtype=np.float64)
+        self.y = np.array(y_s, dtype=np.float64)
+        self.m = np.array(m_s, dtype=np.float64)
+        n = len(self.m)
+        if not(n > 0 and self.x.shape == (n,) and self.y.shape == (n,)):
+            raise ValueError
+        if not(theta >= 0 and softening >= 0 and leaf_size >= 1):
+            raise ValueError
+        self.v_x = np.array(np.broadcast_to(np.asarray(v_x, dtype=np.float64), (n,)))
+        self.v_y = np.array(np.broadcast_to(np.asarray(v_y, dtype=np.float64), (n,)))
+        self.r = np.array(np.broadcast_to(np.asarray(r_s, dtype=np.float64), (n,)))
+        self.grid = None
+        self.G = G
+        self.theta = theta
+        self.softening = softening
+        self.leaf_size = leaf_size
+
+    ## @brief helper method to find the contacts which begin at a time step
+    #  @param k A natural number which is the time step
+    #  @param before A sorted array of the codes i * N + j of the pairs
+    #         in contact at the previous time step
+    #  @return A pair of the (M, 3) array of rows (k, i, j) of the new
+    #          contacts and the sorted codes of all current contacts
+    def __events__(self, k, before):
+        i, j = self.contacts()
+        now = i * len(self) + j
+        new = np.isin(now, before, assume_unique=True, invert=True)
+        rows = np.stack([np.full(int(new.sum()), k), i[new], j[new]], axis=1)
+        return rows, now
+
+    ## @brief helper method to take one leapfrog step
+    #  @param dt A real number which is the length of the step
+    #  @param ax An array which is the x acceleration at the start
+    #  @param ay An array which is the y acceleration at the start
+    #  @return The pair of x and y accelerations at the end of the step
+    def __leapfrog__(self, dt, ax, ay):
+        self.v_x += ax * (dt / 2)
+        self.v_y += ay * (dt / 2)
+        self.x += self.v_x * dt
+        self.y += self.v_y * dt
+        ax, ay = self.accel()
+        self.v_x += ax * (dt / 2)
+        self.v_y += ay * (dt / 2)
+        return ax, ay
+
+    ## @brief helper method to weigh displacements by the force law
+    #  @param dx An array of x displacements from the attracted bodies
+    #  @param dy An array of y displacements from the attracted bodies
+    #  @param m An array of the attracting masses
+    #  @return An array of G m / (d^2 + eps^2)^(3/2), which times the
+    #          displacements gives the accelerations
+    def __kernel__(self, dx, dy, m):
+        d2 = dx * dx + dy * dy + self.softening**2
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(d2 > 0, self.G * m / (d2 * np.sqrt(d2)), 0.0)
+
+    ## @brief helper method to compute the Barnes-Hut accelerations
+    #  @param x An array of the x-components of the bodies
+    #  @param y An array of the y-components of the bodies
+    #  @return A pair of arrays which are the x and y accelerations
+    def __accel__(self, x, y):
+        order, levels = self.__tree__(x, y)
+        xs = x[order]
+        ys = y[order]
+        ms = self.m[order]
+        ax = np.empty(len(x))
+        ay = np.empty(len(x))
+        for lo in range(0, len(x), self.BATCH):
+            bodies = np.arange(lo, min(lo + self.BATCH, len(x)))
+            ax[lo:lo + len(bodies)], ay[lo:lo + len(bodies)] = \
+                self.__walk__(bodies, xs, ys, ms, levels)
+        out_x = np.empty(len(x))
+        out_y = np.empty(len(x))
+        out_x[order] = ax
+        out_y[order] = ay
+        return out_x, out_y
+
+    ## @brief helper method to build the quadtree
+    #  @details Sorts the bodies by Morton code. The cells of each level are
+    #           then the runs of equal code prefixes, so their masses and
+    #           centers of mass are sums over contiguous ranges. Levels are
+    #           built until every cell is a leaf.
+    #  @param x An array of the x-components of the bodies
+    #  @param y An array of the y-components of the bodies
+    #  @return A pair of the sorting permutation of the bodies and a list
+    #          of the levels of the tree, each a dictionary of the 'start'
+    #          and 'end' of each cell's bodies in sorted order, its mass
+    #          'm', center of mass 'cx', 'cy', the 'first' and 'last' of
+    #          its children on the next level, its 'width' and whether
+    #          each cell is a 'leaf'
+    def __tree__(self, x, y):
+        n = len(x)
+        x0 = x.min()
+        y0 = y.min()
+        width = max(x.max() - x0, y.max() - y0)
+        width = width * (1 + 1e-12) if width > 0 else 1.0
+        cells = 1 << self.DEPTH
+        ix = np.minimum((x - x0) * (cells / width), cells - 1).astype(np.uint64)
+        iy = np.minimum((y - y0) * (cells / width), cells - 1).astype(np.uint64)
+        code = self.__spread__(ix) | (self.__spread__(iy) << np.uint64(1))
+        order = np.argsort(code, kind='stable')
+        code = code[order]
+        ms = self.m[order]
+        mxs = ms * x[order]
+        mys = ms * y[order]
+
+        levels = []
+        for depth in range(self.DEPTH + 1):
+            key = code >> np.uint64(2 * (self.DEPTH - depth))
+            start = np.flatnonzero(np.concatenate(([True], key[1:] != key[:-1])))
+            end = np.append(start[1:], n)
+            m = np.add.reduceat(ms, start)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                cx = np.add.reduceat(mxs, start) / m
+                cy = np.add.reduceat(mys, start) / m
+            leaf = end - start <= self.leaf_size
+            if depth == self.DEPTH:
+                leaf[:] = True
+            levels.append({'start': start, 'end': end, 'm': m, 'cx': cx,
+                           'cy': cy, 'width': width / (1 << depth), 'leaf': leaf})
+            if depth > 0:
+                parent = levels[depth - 1]
+                parent['first'] = np.searchsorted(start, parent['start'])
+                parent['last'] = np.searchsorted(start, parent['end'])
+            if np.all(leaf):
+                break
+
+        return order, levels
+
+    ## @brief helper method to walk the quadtree for a batch of bodies
+    #  @param bodies An array of the sorted indices of the bodies
+    #  @param xs An array of the sorted x-components of every body
+    #  @param ys An array of the sorted y-components of every body
+    #  @param ms An array of the sorted masses of every body
+    #  @param levels A list of the levels of the tree
+    #  @return A pair of arrays which are the x and y accelerations of
+    #          the bodies
+    def __walk__(self, bodies, xs, ys, ms, levels):
+        n = len(bodies)
+        ax = np.zeros(n)
+        ay = np.zeros(n)
+        pb = np.arange(n)
+        pc = np.zeros(n, dtype=np.intp)
+        for level in levels:
+            if len(pb) == 0:
+                break
+            dx = level['cx'][pc] - xs[bodies[pb]]
+            dy = level['cy'][pc] - ys[bodies[pb]]
+            far = level['width']**2 < self.theta**2 * (dx * dx + dy * dy)
+            w = self.__kernel__(dx[far], dy[far], level['m'][pc[far]])
+            ax += np.bincount(pb[far], weights=w * dx[far], minlength=n)
+            ay += np.bincount(pb[far], weights=w * dy[far], minlength=n)
+
+            near = ~far
+            leaf = near & level['leaf'][pc]
+            b, j = Ranges.expand(pb[leaf], level['start'][pc[leaf]],
+                                 level['end'][pc[leaf]])
+            keep = bodies[b] != j
+            b = b[keep]
+            j = j[keep]
+            dx = xs[j] - xs[bodies[b]]
+            dy = ys[j] - ys[bodies[b]]
+            w = self.__kernel__(dx, dy, ms[j])
+            ax += np.bincount(b, weights=w * dx, minlength=n)
+            ay += np.bincount(b, weights=w * dy, minlength=n)
+
+            inner = near & ~level['leaf'][pc]
+            if np.any(inner):
+                pb, pc = Ranges.expand(pb[inner], level['first'][pc[inner]],
+                                       level['last'][pc[inner]])
+            else:
+                pb = pb[:0]
+        return ax, ay
+
+    ## @brief helper method to spread the bits of integers for Morton codes
+    #  @param v An array of unsigned integers below 2^DEPTH
+    #  @return An array with bit k of each integer moved to bit 2k
+    @staticmethod
+    def __spread__(v):
+        v = v & np.uint64(0xFFFFFFFF)
+        for shift, mask in ((16, 0x0000FFFF0000FFFF), (8, 0x00FF00FF00FF00FF),
+                            (4, 0x0F0F0F0F0F0F0F0F), (2, 0x3333333333333333),
+                            (1, 0x5555555555555555)):
+            v = (v | (v << np.uint64(shift))) & np.uint64(mask)
+        return v
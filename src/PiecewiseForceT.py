@@ -0,0 +1,74 @@
+## @file PiecewiseForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a piecewise force ADT
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+from ConstForceT import ConstForceT
+from ForceT import ForceT
+from SumForceT import SumForceT
+
+## @brief Defines a piecewise force ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the ForceT interface. With breakpoints
+#           b_1 < ... < b_n, the force is the piece F_0 before b_1,
+#           F_k from b_k up to b_(k+1), and F_n from b_n on.
+
+
+class PiecewiseForceT(ForceT):
+    __slots__ = ('b', 'Fs')
+
+    ## @brief Constructor for PiecewiseForceT
+    #  @param b A sequence of n strictly increasing real numbers which are
+    #         the breakpoints
+    #  @param Fs A sequence of n + 1 ForceT objects which are the pieces
+    #  @throws ValueError if the breakpoints aren't strictly increasing or
+    #          there isn't one more piece than breakpoints
+    def __init__(self, b, Fs):
+        self.b = tuple(float(bk) for bk in b)
+        self.Fs = tuple(Fs)
+        if not(len(self.Fs) == len(self.b) + 1):
+            raise ValueError
+        if not all(b0 < b1 for b0, b1 in zip(self.b, self.b[1:])):
+            raise ValueError
+
+    ## @brief Evaluates the force
+    #  @param t A 1-D array of real numbers which are times
+    #  @returns An array of real numbers which is the force at each time
+    def at(self, t):
+        piece = np.searchsorted(self.b, t, side='right')
+        f = np.empty(t.shape)
+        for k, F in enumerate(self.Fs):
+            mask = piece == k
+            if np.any(mask):
+                f[mask] = F.at(t[mask])
+        return f
+
+    ## @brief Getter for the antiderivative of the force
+    #  @details The antiderivatives of the pieces are shifted by constants
+    #           so they join continuously at the breakpoints, and the whole
+    #           is shifted to be zero at time 0
+    #  @returns A PiecewiseForceT of the antiderivatives of the pieces
+    def antideriv(self):
+        A = [F.antideriv() for F in self.Fs]
+        shift = [0.0]
+        for k, bk in enumerate(self.b):
+            shift.append(shift[k] + A[k](bk) - A[k + 1](bk))
+        zero = shift[int(np.searchsorted(self.b, 0.0, side='right'))]
+        pieces = [SumForceT([Ak, ConstForceT(ck - zero)]) for Ak, ck in zip(A, shift)]
+        return PiecewiseForceT(self.b, pieces)
+
+    ## @brief Getter for the breakpoints of the force
+    #  @returns A sorted tuple of the breakpoints between the pieces and
+    #           within any of them
+    @property
+    def breakpoints(self):
+        inner = set(bk for F in self.Fs for bk in F.breakpoints)
+        return tuple(sorted(inner.union(self.b)))
+
+    ## @brief helper method to collect the state variables of the force
+    #  @return A tuple of the name of the class, the breakpoints and the
+    #          state variables of each piece
+    def __key__(self):
+        return ('PiecewiseForceT', self.b) + tuple(F.__key__() for F in self.Fs)
@@ -6,26 +6,32 @@
 #           as three graphs, using matplotlib
 
 import matplotlib.pyplot as plt
+import numpy as np
+
+from SimResult import SimResult
 
 ## @brief The plot module
 #  @details Uses matplotlib to create 3 plots of:
 #   x vs t, y vs t, and y vs x
 #  @param w A sequence of real numbers which is generated
-#           by the sim method in Scene.py
+#           by the sim method in Scene.py, or the SimResult itself
 #  @param t A sequence of real numbers which represent
-#           the time steps in the simulation
+#           the time steps in the simulation, or None if w is a SimResult
 #  @throws ValueError if lengths of w and t are not equal
 
 
-def plot(w, t):
+def plot(w, t=None):
+    if isinstance(w, SimResult):
+        t, w = w
     if not(len(w) == len(t)):
         raise ValueError
 
     fig, axs = plt.subplots(3)
     fig.suptitle('Motion Simulation')
 
-    x = [w[i][0] for i in range(len(w))]
-    y = [w[i][1] for i in range(len(w))]
+    w = np.asarray(w)
+    x = w[:, 0]
+    y = w[:, 1]
 
     axs[0].plot(t, x)
     axs[0].set_xlabel('t(seconds)')
@@ -0,0 +1,48 @@
+## @file PolyForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a polynomial force ADT
+#  @date Oct. 17, 2026
+
+import numpy.polynomial.polynomial as P
+
+from ForceT import ForceT
+
+## @brief Defines a polynomial force ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the ForceT interface. The force is
+#           c_0 + c_1 t + ... + c_n t^n.
+
+
+class PolyForceT(ForceT):
+    __slots__ = ('c',)
+
+    ## @brief Constructor for PolyForceT
+    #  @param c A sequence of real numbers which are the coefficients of
+    #         t^0, t^1, ..., t^n
+    #  @throws ValueError if there are no coefficients
+    def __init__(self, c):
+        self.c = tuple(float(ck) for ck in c)
+        if len(self.c) == 0:
+            raise ValueError
+
+    ## @brief Getter for the coefficients of the polynomial
+    #  @returns A tuple of real numbers which are the coefficients of
+    #           t^0, t^1, ..., t^n
+    def coeffs(self):
+        return self.c
+
+    ## @brief Evaluates the force
+    #  @param t A 1-D array of real numbers which are times
+    #  @returns An array of real numbers which is the force at each time
+    def at(self, t):
+        return P.polyval(t, self.c)
+
+    ## @brief Getter for the antiderivative of the force
+    #  @returns A PolyForceT which is the antiderivative, zero at time 0
+    def antideriv(self):
+        return PolyForceT(P.polyint(self.c))
+
+    ## @brief helper method to collect the state variables of the force
+    #  @return A tuple of the name of the class and the coefficients
+    def __key__(self):
+        return ('PolyForceT', self.c)
@@ -0,0 +1,36 @@
+## @file Ranges.py
+#  @author Mihail Serafimovski
+#  @brief Defines the ranges module
+#  @date Oct. 17, 2026
+#  @details The ranges module expands many index ranges at once with
+#           array operations, which the spatial indices use to walk all
+#           of their queries together.
+
+import numpy as np
+
+
+## @brief Lists the indices of many ranges
+#  @param start An array of the start of each range
+#  @param end An array of the end of each range, where a range with an
+#         end before its start is empty
+#  @returns An array of the indices in every range, range by range
+
+
+def ranges(start, end):
+    count = np.maximum(end - start, 0)
+    offset = np.arange(count.sum()) - np.repeat(np.cumsum(count) - count, count)
+    return np.repeat(start, count) + offset
+
+
+## @brief Expands pairs over ranges
+#  @param owner An array of the first element of each pair
+#  @param lo An array of the start of each pair's range
+#  @param hi An array of the end of each pair's range, where a range with
+#         an end before its start is empty
+#  @returns A pair of arrays, repeating each owner once per element of
+#           its range alongside that element
+
+
+def expand(owner, lo, hi):
+    count = np.maximum(hi - lo, 0)
+    return np.repeat(owner, count), ranges(lo, hi)
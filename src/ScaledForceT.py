@@ -0,0 +1,45 @@
+## @file ScaledForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a scaled force ADT
+#  @date Oct. 17, 2026
+
+from ForceT import ForceT
+
+## @brief Defines a scaled force ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the ForceT interface. The force is another force
+#           multiplied by a real number.
+
+
+class ScaledForceT(ForceT):
+    __slots__ = ('F', 'c')
+
+    ## @brief Constructor for ScaledForceT
+    #  @param F A ForceT which is the force being scaled
+    #  @param c A real number which is the factor
+    def __init__(self, F, c):
+        self.F = F
+        self.c = float(c)
+
+    ## @brief Evaluates the force
+    #  @param t A 1-D array of real numbers which are times
+    #  @returns An array of real numbers which is the force at each time
+    def at(self, t):
+        return self.c * self.F.at(t)
+
+    ## @brief Getter for the antiderivative of the force
+    #  @returns A ScaledForceT of the antiderivative of the scaled force
+    def antideriv(self):
+        return ScaledForceT(self.F.antideriv(), self.c)
+
+    ## @brief Getter for the breakpoints of the force
+    #  @returns A sorted tuple of the breakpoints of the scaled force
+    @property
+    def breakpoints(self):
+        return self.F.breakpoints
+
+    ## @brief helper method to collect the state variables of the force
+    #  @return A tuple of the name of the class, the scaled force's state
+    #          variables and the factor
+    def __key__(self):
+        return ('ScaledForceT', self.F.__key__(), self.c)
@@ -5,7 +5,14 @@
 #   environment. A scene features a shape, forces, and initial velocities
 #  @date Feb. 10, 2021
 
-import scipy.integrate as sp
+import time
+
+import numpy as np
+
+import Force
+import Integrators
+from SimCache import fingerprint
+from SimResult import SimResult
 
 ## @brief Defines the scene module
 #  @details The scene module is used for simulating a physical
@@ -28,6 +35,7 @@ class Scene:
         self.F_y = F_y
         self.v_x = v_x
         self.v_y = v_y
+        self.cache = None
 
     ## @brief Getter for the scene's shape
     #  @returns A Shape object which is the shape
@@ -68,24 +76,180 @@ class Scene:
         self.v_x = new_v_x
         self.v_y = new_v_y
 
+    ## @brief Getter for the scene's result cache
+    #  @returns The SimCache which sim looks results up in, or None
+    def get_cache(self):
+        return self.cache
+
+    ## @brief Setter for the scene's result cache
+    #  @details A cache may be shared by many scenes, since its results are
+    #           addressed by the mass and center of mass of the shape, the
+    #           initial velocities, the time grid, the integrator settings
+    #           and the fingerprints of the forces. Scenes whose forces
+    #           can't be fingerprinted are simulated without the cache.
+    #  @param cache A SimCache, or None to stop caching
+    def set_cache(self, cache):
+        self.cache = cache
+
     ## @brief Simulates motion of the shape in the scene
     #  @details Solves Newton's motion differential equation for
-    #           different steps in time
+    #           different steps in time, using one of the backends
+    #           registered in the Integrators module: 'odeint' (the
+    #           default), the solve_ivp methods 'RK45', 'RK23', 'DOP853',
+    #           'Radau', 'BDF' and 'LSODA' with dense output, 'quad' which
+    #           integrates the forces by cumulative quadrature, and the
+    #           fixed-step 'rk4' and 'verlet' engines. Since the forces
+    #           only depend on time, the last three evaluate each force
+    #           on the whole time grid at once. 'exact' computes the motion
+    #           in closed form from the antiderivatives of ForceT forces,
+    #           and 'auto' does so whenever both forces are ForceT forces,
+    #           falling back to 'odeint' otherwise. If the forces declare
+    #           breakpoints (see the Force module), the motion is
+    #           integrated segment by segment between them.
     #  @param t_final A real number which specifies the amount
     #         of time the simulation should run for
     #  @param nsteps A natural number which specifies how many
     #         steps of time there should be in the simulation
-    #  @returns A sequence of real numbers representing the time steps and a
-    #           second sequence with the results of scipy's odeint calculations
-    def sim(self, t_final, nsteps):
-        def ode(w, t):
-            param_3 = self.F_x(t) / self.s.mass()
-            param_4 = self.F_y(t) / self.s.mass()
-            return w[2], w[3], param_3, param_4
-
-        t = []
-        for i in range(nsteps):
-            t.append(i * t_final / (nsteps - 1))
+    #  @param method A string which is the name of the integrator backend
+    #  @param rtol A real number which is the relative tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param atol A real number which is the absolute tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param max_step A real number which is the largest step an adaptive
+    #         backend may take, or None for no limit
+    #  @param full_output A boolean, true to return the statistics
+    #         of the run as a third value
+    #  @returns A SimResult, which unpacks into an array of the time steps
+    #           and an array with the results of the integrator. Its
+    #           statistics are a dictionary with the method, the number of
+    #           right-hand side evaluations 'nfev', the number of
+    #           'segments' integrated, the wall time 'wall_time' in
+    #           seconds and the dense output function 'dense' (None if
+    #           the backend has none). If the result was looked up in a
+    #           cache the statistics also hold 'cache', which is 'hit' or
+    #           'miss', and a hit has nfev 0 and read-only results. If
+    #           full_output is true, the time steps, results and
+    #           statistics are returned as a tuple instead.
+    #  @throws ValueError if the method is unknown
+    def sim(self, t_final, nsteps, method='odeint', rtol=None, atol=None,
+            max_step=None, full_output=False):
+        t = np.arange(nsteps) * t_final / (nsteps - 1)
 
         ode_init_conds = [self.s.cm_x(), self.s.cm_y(), self.v_x, self.v_y]
-        return t, sp.odeint(ode, ode_init_conds, t)
+        opts = {'rtol': rtol, 'atol': atol, 'max_step': max_step}
+        key = self.__cache_key__(t_final, nsteps, method, opts)
+        hit = None if key is None else self.cache.get(key)
+        if hit is not None:
+            w = hit[0]
+            stats = dict(hit[1], method=method, nfev=0, wall_time=0.0, cache='hit')
+        else:
+            w, stats = self.__run__(ode_init_conds, t, method, opts)
+        if key is not None and hit is None:
+            w = self.cache.put(key, np.asfortranarray(w), stats)
+            stats = dict(stats, cache='miss')
+
+        if full_output:
+            return t, w, stats
+        return SimResult(t, w, stats)
+
+    ## @brief Resumes a simulation of the scene from a checkpoint
+    #  @details Integrates only the interval after the checkpoint, starting
+    #           from its state rather than from the scene's shape and
+    #           initial velocities. The time steps are t0 + i * t_extra /
+    #           (nsteps - 1), with t0 the time of the checkpoint.
+    #  @param checkpoint A Checkpoint, such as SimResult.checkpoint returns
+    #  @param t_extra A real number which specifies the amount of time
+    #         the simulation should continue for
+    #  @param nsteps A natural number which specifies how many
+    #         steps of time there should be in the continuation
+    #  @param method A string which is the name of the integrator backend
+    #  @param rtol A real number which is the relative tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param atol A real number which is the absolute tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param max_step A real number which is the largest step an adaptive
+    #         backend may take, or None for no limit
+    #  @returns A SimResult of the continuation, whose first time step is
+    #           the checkpoint
+    #  @throws ValueError if the method is unknown
+    def continue_sim(self, checkpoint, t_extra, nsteps, method='odeint',
+                     rtol=None, atol=None, max_step=None):
+        t = checkpoint.time() + np.arange(nsteps) * t_extra / (nsteps - 1)
+        opts = {'rtol': rtol, 'atol': atol, 'max_step': max_step}
+        w, stats = self.__run__(list(checkpoint.state()), t, method, opts)
+        return SimResult(t, w, stats)
+
+    ## @brief Simulates motion of the shape in the scene window by window
+    #  @details Gives the same time steps as sim, but integrates them in
+    #           windows of at most chunk steps, starting each window from
+    #           the last state of the previous one, so memory doesn't grow
+    #           with nsteps
+    #  @param t_final A real number which specifies the amount
+    #         of time the simulation should run for
+    #  @param nsteps A natural number which specifies how many
+    #         steps of time there should be in the simulation
+    #  @param chunk A natural number which is the largest number of
+    #         time steps in a window
+    #  @param method A string which is the name of the integrator backend
+    #  @param rtol A real number which is the relative tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param atol A real number which is the absolute tolerance of an
+    #         adaptive backend, or None for its default
+    #  @param max_step A real number which is the largest step an adaptive
+    #         backend may take, or None for no limit
+    #  @returns A generator of SimResult objects, one per window, which
+    #           unpack into the pair (t_chunk, w_chunk) of arrays
+    #  @throws ValueError if the method is unknown
+    def sim_iter(self, t_final, nsteps, chunk=1 << 16, method='odeint',
+                 rtol=None, atol=None, max_step=None):
+        Integrators.get(method)
+        opts = {'rtol': rtol, 'atol': atol, 'max_step': max_step}
+        w_last = [self.s.cm_x(), self.s.cm_y(), self.v_x, self.v_y]
+        first = 0
+        for lo in range(0, nsteps, chunk):
+            t = np.arange(lo - first, min(lo + chunk, nsteps)) * t_final / (nsteps - 1)
+            w, stats = self.__run__(w_last, t, method, opts)
+            w_last = w[-1]
+            yield SimResult(t[first:], w[first:], stats)
+            first = 1
+
+    ## @brief helper method to integrate the motion with a backend
+    #  @details Splits the integration at the breakpoints of the forces
+    #  @param w0 A sequence of real numbers which is the initial state
+    #            x, y, v_x, v_y
+    #  @param t An array of real numbers which are the time steps
+    #  @param method A string which is the name of the integrator backend
+    #  @param opts A dictionary of the backend's rtol, atol and max_step
+    #  @return A tuple of the array of results of the integrator and the
+    #          dictionary of statistics of the run
+    #  @throws ValueError if the method is unknown
+    def __run__(self, w0, t, method, opts):
+        backend = Integrators.get(method)
+        breaks = Force.breakpoints((self.F_x, self.F_y), t[0], t[-1])
+        start = time.perf_counter()
+        w, nfev, dense = Integrators.segmented(backend, breaks, self.F_x, self.F_y,
+                                               self.s.mass(), w0, t, opts)
+        stats = {'method': method, 'nfev': nfev,
+                 'wall_time': time.perf_counter() - start, 'dense': dense,
+                 'segments': len(breaks) + 1}
+        return w, stats
+
+    ## @brief helper method to compute the cache key of a simulation
+    #  @param t_final A real number which is the duration of the simulation
+    #  @param nsteps A natural number which is the number of time steps
+    #  @param method A string which is the name of the integrator backend
+    #  @param opts A dictionary of the backend's rtol, atol and max_step
+    #  @return A string which is the key, or None if the scene has no cache
+    #          or its forces can't be fingerprinted
+    def __cache_key__(self, t_final, nsteps, method, opts):
+        if self.cache is None:
+            return None
+        forces_fp = (fingerprint(self.F_x), fingerprint(self.F_y))
+        if None in forces_fp:
+            return None
+
+        return self.cache.key((float(self.s.mass()), float(self.s.cm_x()),
+                               float(self.s.cm_y()), float(self.v_x),
+                               float(self.v_y), float(t_final), int(nsteps),
+                               method, opts['rtol'], opts['atol'],
+                               opts['max_step']) + forces_fp)
@@ -0,0 +1,177 @@
+## @file SceneEnsemble.py
+#  @author Mihail Serafimovski
+#  @brief Defines a scene ensemble module
+#  @details The scene ensemble module simulates many scenes at once,
+#   as one system of differential equations with a vectorized
+#   right-hand side
+#  @date Oct. 17, 2026
+
+import numpy as np
+import scipy.integrate as sp
+
+import Integrators
+
+## @brief Defines the scene ensemble module
+#  @details An ensemble of N scenes, each with its own shape and initial
+#   velocities, is stacked into a single state of length 4N. The forces
+#   are functions F(t, i) of a time t and an array i of scene indices,
+#   returning the force on each of those scenes (or one real number
+#   shared by all of them). A force with a true vectorized attribute may
+#   also be called with a column (T, 1) of times, and returns a (T, N)
+#   array, or anything which broadcasts to it.
+
+
+class SceneEnsemble:
+    ## @brief Constructor for SceneEnsemble
+    #  @param shapes A sequence of N shapes whose motion is to be simulated
+    #  @param F_x A function F(t, i) which represents the unbalanced force
+    #         in the x-direction on the scenes with indices i at time t
+    #  @param F_y A function F(t, i) which represents the unbalanced force
+    #         in the y-direction on the scenes with indices i at time t
+    #  @param v_x A real number, or a sequence of N real numbers, which is
+    #         the initial velocity in the x-dir of each scene
+    #  @param v_y A real number, or a sequence of N real numbers, which is
+    #         the initial velocity in the y-dir of each scene
+    #  @throws ValueError if there are no shapes, or if v_x or v_y don't
+    #          have one value per shape
+    def __init__(self, shapes, F_x, F_y, v_x, v_y):
+        n = len(shapes)
+        if n == 0:
+            raise ValueError
+
+        self.shapes = list(shapes)
+        self.F_x = F_x
+        self.F_y = F_y
+        self.m = np.array([s.mass() for s in shapes], dtype=np.float64)
+        self.x = np.array([s.cm_x() for s in shapes], dtype=np.float64)
+        self.y = np.array([s.cm_y() for s in shapes], dtype=np.float64)
+        self.v_x = self.__per_scene__(v_x, n)
+        self.v_y = self.__per_scene__(v_y, n)
+
+    ## @brief Constructs an ensemble from a sequence of scenes
+    #  @details Scenes which all share the same force function have it
+    #           called once per evaluation for the whole ensemble. The
+    #           combined force is vectorized if every scene's force is.
+    #  @param scenes A sequence of Scene objects
+    #  @returns A SceneEnsemble of the scenes, in the same order
+    #  @throws ValueError if there are no scenes
+    @classmethod
+    def from_scenes(cls, scenes):
+        forces = [sc.get_unbal_forces() for sc in scenes]
+        velos = [sc.get_init_velo() for sc in scenes]
+        return cls([sc.get_shape() for sc in scenes],
+                   cls.__gather__([f[0] for f in forces]),
+                   cls.__gather__([f[1] for f in forces]),
+                   [v[0] for v in velos], [v[1] for v in velos])
+
+    ## @brief Getter for the number of scenes in the ensemble
+    #  @returns A natural number which is the number of scenes
+    def __len__(self):
+        return len(self.shapes)
+
+    ## @brief Simulates motion of the shapes of every scene
+    #  @details With 'odeint' the scenes are integrated as one system of
+    #           size 4N whose right-hand side calls each force once per
+    #           evaluation. With one of the fixed-step backends of the
+    #           Integrators module ('quad', 'rk4' or 'verlet') a vectorized
+    #           force is called once on every time step at once, any other
+    #           force once per time step, and the scenes are integrated
+    #           together with array operations.
+    #  @param t_final A real number which specifies the amount
+    #         of time the simulation should run for
+    #  @param nsteps A natural number which specifies how many
+    #         steps of time there should be in the simulation
+    #  @param method A string which is 'odeint' or the name of a fixed-step
+    #         integrator backend
+    #  @param rtol A real number which is the relative tolerance of
+    #         odeint, or None for its default
+    #  @param atol A real number which is the absolute tolerance of
+    #         odeint, or None for its default
+    #  @returns An array of real numbers representing the time steps and
+    #           an (N, nsteps, 4) array with the x, y, v_x, v_y of each
+    #           scene at each time step
+    #  @throws ValueError if the method is unknown
+    def sim(self, t_final, nsteps, method='odeint', rtol=None, atol=None):
+        t = np.arange(nsteps) * t_final / (nsteps - 1)
+        w0 = [self.x, self.y, self.v_x, self.v_y]
+        if method == 'odeint':
+            return t, self.__odeint__(w0, t, rtol, atol)
+        if method not in Integrators.GRID_METHODS:
+            raise ValueError
+
+        idx = np.arange(len(self))
+        backend = Integrators.get(method)
+        w = backend(self.__grid__(self.F_x, idx), self.__grid__(self.F_y, idx),
+                    1, w0, t, {'rtol': rtol, 'atol': atol, 'max_step': None})[0]
+        return t, w
+
+    ## @brief helper method to integrate the stacked system with odeint
+    #  @details The state interleaves x, y, v_x, v_y scene by scene, so the
+    #           Jacobian is banded and odeint's memory stays linear in N
+    #  @param w0 A sequence of 4 arrays which are the initial x, y, v_x, v_y
+    #  @param t An array of real numbers which are the time steps
+    #  @param rtol A real number which is the relative tolerance, or None
+    #  @param atol A real number which is the absolute tolerance, or None
+    #  @return An (N, nsteps, 4) array of the state of each scene
+    def __odeint__(self, w0, t, rtol, atol):
+        n = len(self)
+        idx = np.arange(n)
+
+        def ode(w, t):
+            w = w.reshape(n, 4)
+            dw = np.empty_like(w)
+            dw[:, :2] = w[:, 2:]
+            dw[:, 2] = self.F_x(t, idx) / self.m
+            dw[:, 3] = self.F_y(t, idx) / self.m
+            return dw.ravel()
+
+        w0 = np.stack(w0, axis=1).ravel()
+        w = sp.odeint(ode, w0, t, rtol=rtol, atol=atol, ml=0, mu=2)
+        return w.reshape(len(t), n, 4).transpose(1, 0, 2)
+
+    ## @brief helper method to turn a force into accelerations on a grid
+    #  @param F A function F(t, i) of a time and an array of scene indices
+    #  @param idx An array of the indices of every scene
+    #  @return A vectorized function of an array of times, returning an
+    #          (N, len(t)) array of the acceleration of each scene
+    def __grid__(self, F, idx):
+        if getattr(F, 'vectorized', False):
+            def grid(t):
+                f = np.asarray(F(t[:, np.newaxis], idx), dtype=np.float64)
+                return (np.broadcast_to(f, (len(t), len(idx))) / self.m).T
+        else:
+            def grid(t):
+                f = [np.broadcast_to(F(tk, idx), idx.shape) for tk in t]
+                return (np.array(f) / self.m).T
+
+        grid.vectorized = True
+        return grid
+
+    ## @brief helper method to spread a value over the scenes
+    #  @param v A real number or a sequence of n real numbers
+    #  @param n A natural number which is the number of scenes
+    #  @return An array of n real numbers
+    #  @throws ValueError if v is a sequence of the wrong length
+    @staticmethod
+    def __per_scene__(v, n):
+        v = np.asarray(v, dtype=np.float64)
+        if not(v.ndim == 0 or v.shape == (n,)):
+            raise ValueError
+        return np.array(np.broadcast_to(v, (n,)))
+
+    ## @brief helper method to combine per-scene forces into one function
+    #  @param fs A sequence of functions of time, one per scene
+    #  @return A function F(t, i) of a time, or a column of times, and an
+    #          array of scene indices, vectorized if every one of fs is
+    @staticmethod
+    def __gather__(fs):
+        if all(f is fs[0] for f in fs):
+            def F(t, i):
+                return fs[0](t)
+        else:
+            def F(t, i):
+                f = [np.broadcast_to(fs[k](t), np.shape(t)) for k in i]
+                return np.asarray(np.hstack(f), dtype=np.float64)
+
+        F.vectorized = all(getattr(f, 'vectorized', False) for f in fs)
+        return F
@@ -5,12 +5,16 @@
 
 from abc import ABC, abstractmethod
 
+import numpy as np
+
 ## @brief Shape defines a Shape interface module
 #  @details The Shape interface provides abstract methods
-#   which need to be overwritten by classes that inherit it
+#   which need to be overwritten by classes that inherit it, and
+#   methods derived from them
 
 
 class Shape(ABC):
+    __slots__ = ()
 
     @abstractmethod
     ## @brief A generic method related to the x-componenet of the
@@ -37,3 +41,34 @@ class Shape(ABC):
     #  @return a real number which is the moment of inertia of the shape
     def m_inert(self):
         pass
+
+    ## @brief The radius of the shape about its center of mass
+    #  @details Shapes without an extent are treated as points, with
+    #           radius 0. Shapes with one override this method.
+    #  @return A real number which is the radius of the smallest circle
+    #          about the center of mass which contains the shape
+    def radius(self):
+        return 0.0
+
+    ## @brief The moment of inertia of the shape about a pivot point
+    #  @details Uses the parallel axis theorem, so each query takes
+    #           constant time
+    #  @param px A real number which is the x-component of the pivot
+    #  @param py A real number which is the y-component of the pivot
+    #  @return A real number which is the moment of inertia of the shape
+    #          about the pivot
+    def m_inert_about(self, px, py):
+        d2 = (self.cm_x() - px)**2 + (self.cm_y() - py)**2
+        return self.m_inert() + self.mass() * d2
+
+    ## @brief The moments of inertia of the shape about many pivot points
+    #  @param px_s An array-like of real numbers which are the
+    #              x-components of the pivots
+    #  @param py_s An array-like of real numbers which are the
+    #              y-components of the pivots
+    #  @return An array of real numbers which are the moments of inertia
+    #          of the shape about each pivot
+    def m_inert_about_many(self, px_s, py_s):
+        dx = self.cm_x() - np.asarray(px_s, dtype=np.float64)
+        dy = self.cm_y() - np.asarray(py_s, dtype=np.float64)
+        return self.m_inert() + self.mass() * (dx * dx + dy * dy)
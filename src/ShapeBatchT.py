@@ -0,0 +1,151 @@
+## @file ShapeBatchT.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which specifies a batch of circles and triangles
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+from CircleT import CircleT
+from TriangleT import TriangleT
+
+## @brief Defines a shape batch ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Stores many circles and triangles as contiguous columns of
+#           kind, x, y, size (radius or side length) and mass, so that the
+#           Shape queries are answered for the whole batch at once. Slicing
+#           a batch returns a batch of views on the same columns.
+
+
+class ShapeBatchT:
+    ## @brief Kind code of a circle in the kind column
+    CIRCLE = 0
+    ## @brief Kind code of a triangle in the kind column
+    TRIANGLE = 1
+
+    ## @brief Constructor for ShapeBatchT
+    #  @param kind An array-like of kind codes, CIRCLE or TRIANGLE
+    #  @param x An array-like of real numbers which are the x-components
+    #           of the centers of mass
+    #  @param y An array-like of real numbers which are the y-components
+    #           of the centers of mass
+    #  @param size An array-like of real numbers which are the radius of
+    #              each circle or side length of each triangle
+    #  @param m An array-like of real numbers which are the masses
+    #  @throws ValueError if the columns aren't the same length, if a kind
+    #          code is unknown, or if a size or mass is not greater than zero
+    def __init__(self, kind, x, y, size, m):
+        self.kind = np.asarray(kind, dtype=np.uint8)
+        self.x = np.asarray(x, dtype=np.float64)
+        self.y = np.asarray(y, dtype=np.float64)
+        self.size = np.asarray(size, dtype=np.float64)
+        self.m = np.asarray(m, dtype=np.float64)
+
+        shapes = {c.shape for c in (self.kind, self.x, self.y, self.size, self.m)}
+        if not(len(shapes) == 1 and self.kind.ndim == 1):
+            raise ValueError
+        if not np.all(self.kind <= self.TRIANGLE):
+            raise ValueError
+        if not(np.all(self.size > 0) and np.all(self.m > 0)):
+            raise ValueError
+
+    ## @brief Constructs a batch from a sequence of shapes
+    #  @param shapes A sequence of CircleT and TriangleT objects
+    #  @returns A ShapeBatchT holding the given shapes in order
+    #  @throws ValueError if a shape is neither a CircleT nor a TriangleT
+    @classmethod
+    def from_shapes(cls, shapes):
+        kind = []
+        size = []
+        for s in shapes:
+            if isinstance(s, CircleT):
+                kind.append(cls.CIRCLE)
+                size.append(s.r)
+            elif isinstance(s, TriangleT):
+                kind.append(cls.TRIANGLE)
+                size.append(s.s)
+            else:
+                raise ValueError
+
+        return cls(kind, [s.cm_x() for s in shapes], [s.cm_y() for s in shapes],
+                   size, [s.mass() for s in shapes])
+
+    ## @brief Getter for x-components of the centers of mass
+    #  @returns An array of real numbers which are the x-components
+    #           of the shapes' centers of mass
+    def cm_x(self):
+        return self.x
+
+    ## @brief Getter for y-components of the centers of mass
+    #  @returns An array of real numbers which are the y-components
+    #           of the shapes' centers of mass
+    def cm_y(self):
+        return self.y
+
+    ## @brief Getter for masses of the shapes
+    #  @returns An array of real numbers which are the masses of the shapes
+    def mass(self):
+        return self.m
+
+    ## @brief Getter for moments of inertia of the shapes
+    #  @returns An array of real numbers which are the moments of inertia
+    #           of the shapes
+    def m_inert(self):
+        factor = np.where(self.kind == self.CIRCLE, 1 / 2, 1 / 12)
+        return self.m * self.size**2 * factor
+
+    ## @brief Getter for radii of the shapes
+    #  @returns An array of real numbers which are the radii of the
+    #           circles and the circumradii of the triangles
+    def radius(self):
+        return self.size * np.where(self.kind == self.CIRCLE, 1, 1 / 3**0.5)
+
+    ## @brief Keeps only the shapes selected by a mask
+    #  @param mask An array-like of booleans, one per shape
+    #  @returns A ShapeBatchT of the selected shapes
+    def filter(self, mask):
+        return self[np.asarray(mask, dtype=bool)]
+
+    ## @brief Getter for the number of shapes in the batch
+    #  @returns A natural number which is the number of shapes
+    def __len__(self):
+        return len(self.kind)
+
+    ## @brief Indexes the batch
+    #  @param i An integer, a slice, or an array of indices or booleans
+    #  @returns A CircleT or TriangleT if i is an integer, otherwise a
+    #           ShapeBatchT of the selected shapes, whose columns are views
+    #           when i is a slice
+    #  @throws IndexError if i is out of range
+    def __getitem__(self, i):
+        if isinstance(i, (int, np.integer)):
+            return self.__shape__(i)
+
+        b = self.__class__.__new__(self.__class__)
+        b.kind = self.kind[i]
+        b.x = self.x[i]
+        b.y = self.y[i]
+        b.size = self.size[i]
+        b.m = self.m[i]
+        return b
+
+    ## @brief Iterates over the shapes of the batch
+    #  @returns An iterator of CircleT and TriangleT objects, each built
+    #           on demand
+    def __iter__(self):
+        return (self.__shape__(i) for i in range(len(self)))
+
+    ## @brief helper method to build a single shape of the batch
+    #  @param i An integer which is the index of the shape
+    #  @return A CircleT or TriangleT which is the shape at index i
+    def __shape__(self, i):
+        cls = CircleT if self.kind[i] == self.CIRCLE else TriangleT
+        return cls(float(self.x[i]), float(self.y[i]), float(self.size[i]),
+                   float(self.m[i]))
+
+    ## @brief Method to help with object comparison when testing
+    #  @param other Another batch to test for equality
+    #  @returns A boolean, true iff both batches hold the same shapes
+    def __eq__(self, other):
+        return all(np.array_equal(a, b) for a, b in zip(
+            (self.kind, self.x, self.y, self.size, self.m),
+            (other.kind, other.x, other.y, other.size, other.m)))
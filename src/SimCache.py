@@ -0,0 +1,314 @@
+## @file SimCache.py
+#  @author Mihail Serafimovski
+#  @brief Defines a cache of simulation results
+#  @date Oct. 17, 2026
+#  @details Results are addressed by the content of what was simulated:
+#           the mass and center of mass of the shape, the initial
+#           velocities, the time grid, the integrator settings and a
+#           fingerprint of each force function.
+
+import collections
+import hashlib
+import os
+import sys
+import sysconfig
+import types
+
+import numpy as np
+
+## @brief The types whose repr is used as part of a fingerprint
+__LEAVES__ = (int, float, complex, str, bytes, bool, type(None))
+
+## @brief The directories installed packages are imported from
+__LIBRARIES__ = tuple({os.path.realpath(sysconfig.get_paths()[k]) + os.sep
+                       for k in ('purelib', 'platlib')})
+
+
+## @brief Computes a fingerprint of a force function
+#  @details Functions with a fingerprint method are asked for theirs.
+#           Otherwise the fingerprint covers the function's bytecode,
+#           constants, defaults, closure, and the globals it or the code
+#           nested in it reads, where these are numbers, strings, arrays,
+#           modules of the standard library or of installed packages,
+#           tuples of them or other functions. A function which reads
+#           anything else can't be fingerprinted, since its results may
+#           change without it.
+#  @param F A function which inputs and outputs real numbers
+#  @returns A string which is the fingerprint of F, or None if F can't be
+#           fingerprinted
+
+
+def fingerprint(F):
+    h = hashlib.sha256()
+    if not __feed__(h, F, set()):
+        return None
+    return h.hexdigest()
+
+
+## @brief helper function to feed a value into a hash
+#  @param h A hashlib object which is updated
+#  @param v The value to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if the value could be fed, False otherwise
+
+
+def __feed__(h, v, seen):
+    for kinds, feed in __FEEDERS__:
+        if isinstance(v, kinds):
+            return feed(h, v, seen)
+    if callable(getattr(v, 'fingerprint', None)):
+        return __feed_fingerprint__(h, v, seen)
+    if isinstance(v, types.FunctionType):
+        return __feed_function__(h, v, seen)
+    return False
+
+
+## @brief helper function to feed a number, string or None into a hash
+#  @param h A hashlib object which is updated
+#  @param v The value to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True
+
+
+def __feed_leaf__(h, v, seen):
+    h.update(repr((type(v).__name__, v)).encode())
+    return True
+
+
+## @brief helper function to feed an array into a hash
+#  @param h A hashlib object which is updated
+#  @param v A NumPy array to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True
+
+
+def __feed_array__(h, v, seen):
+    h.update(repr((v.dtype.str, v.shape)).encode())
+    h.update(np.ascontiguousarray(v).tobytes())
+    return True
+
+
+## @brief helper function to feed a tuple or frozenset into a hash
+#  @param h A hashlib object which is updated
+#  @param v A tuple or frozenset to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if every item could be fed, False otherwise
+
+
+def __feed_items__(h, v, seen):
+    h.update(repr((type(v).__name__, len(v))).encode())
+    items = sorted(v, key=repr) if isinstance(v, frozenset) else v
+    return all(__feed__(h, u, seen) for u in items)
+
+
+## @brief helper function to feed a module into a hash, by name
+#  @details Only modules of the standard library or of installed packages
+#           are taken to be fixed. Any other module, such as one of the
+#           user's own, may hold state which changes, so a function which
+#           reads it can't be fingerprinted.
+#  @param h A hashlib object which is updated
+#  @param v A module to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if the module is fixed, False otherwise
+
+
+def __feed_module__(h, v, seen):
+    top = v.__name__.partition('.')[0]
+    if top not in sys.stdlib_module_names:
+        file = getattr(sys.modules.get(top, v), '__file__', None)
+        if file is None or not os.path.realpath(file).startswith(__LIBRARIES__):
+            return False
+    h.update(('module ' + v.__name__).encode())
+    return True
+
+
+## @brief helper function to feed a code object into a hash
+#  @param h A hashlib object which is updated
+#  @param v A code object to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if every constant could be fed, False otherwise
+
+
+def __feed_code__(h, v, seen):
+    h.update(v.co_code)
+    h.update(repr(v.co_names).encode())
+    return all(__feed__(h, c, seen) for c in v.co_consts)
+
+
+## @brief helper function to feed an object's own fingerprint into a hash
+#  @param h A hashlib object which is updated
+#  @param v An object with a fingerprint method
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if the object has a fingerprint, False otherwise
+
+
+def __feed_fingerprint__(h, v, seen):
+    fp = v.fingerprint()
+    h.update(repr(('fingerprint', fp)).encode())
+    return fp is not None
+
+
+## @brief helper function to feed a function into a hash
+#  @param h A hashlib object which is updated
+#  @param v A function to feed
+#  @param seen A set of the ids of the functions already being fed
+#  @returns True if everything the function depends on could be fed,
+#           False otherwise
+
+
+def __feed_function__(h, v, seen):
+    if id(v) in seen:
+        h.update(b'recursion')
+        return True
+    seen.add(id(v))
+    h.update(('function ' + v.__qualname__).encode())
+    cells = tuple(c.cell_contents for c in v.__closure__ or ())
+    names = [n for n in __names__(v.__code__) if n in v.__globals__]
+    parts = (v.__code__, v.__defaults__, cells, getattr(v, 'vectorized', False),
+             tuple(getattr(v, 'breakpoints', ())))
+    parts += tuple((n, v.__globals__[n]) for n in names)
+    return all(__feed__(h, u, seen) for u in parts)
+
+
+## @brief helper function to list the names a code object reads
+#  @details Includes the names read by the code objects nested in it, such
+#           as those of lambdas and comprehensions, which share the
+#           function's globals
+#  @param code A code object
+#  @returns A sorted list of the names read by the code, without repeats
+
+
+def __names__(code):
+    names = set(code.co_names)
+    for c in code.co_consts:
+        if isinstance(c, types.CodeType):
+            names.update(__names__(c))
+    return sorted(names)
+
+
+## @brief The feeders of each kind of plain value, tried in order
+__FEEDERS__ = ((__LEAVES__, __feed_leaf__), (np.ndarray, __feed_array__),
+               ((tuple, frozenset), __feed_items__),
+               (types.ModuleType, __feed_module__), (types.CodeType, __feed_code__))
+
+
+## @brief Defines a cache of simulation results
+#  @details Keeps the most recently used results in memory, within a
+#           budget of bytes, and, if given a directory, every result on
+#           disk as a .npy file which is memory-mapped when read back.
+#           The cached arrays are read-only.
+
+
+class SimCache:
+    ## @brief Constructor for SimCache
+    #  @param max_bytes A natural number which is the largest number of
+    #         bytes of results kept in memory
+    #  @param path A string which is the directory of the on-disk tier,
+    #         or None to only cache in memory
+    def __init__(self, max_bytes=64 << 20, path=None):
+        self.max_bytes = max_bytes
+        self.path = path
+        self.entries = collections.OrderedDict()
+        self.nbytes = 0
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        if path is not None:
+            os.makedirs(path, exist_ok=True)
+
+    ## @brief Computes the key of a simulation
+    #  @param parts A tuple of real numbers, strings and None which describe
+    #         the simulation, or None if it can't be cached
+    #  @returns A string which is the key, or None if parts is None
+    @staticmethod
+    def key(parts):
+        if parts is None:
+            return None
+        h = hashlib.sha256()
+        if not __feed__(h, parts, set()):
+            return None
+        return h.hexdigest()
+
+    ## @brief Looks up a result
+    #  @param key A string which is the key of the simulation
+    #  @returns A tuple of the read-only array of results and the
+    #           dictionary of statistics of the run it came from, or None
+    #           if the result isn't cached
+    def get(self, key):
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return self.entries[key]
+
+        file = self.__path_of__(key)
+        if file is not None and os.path.exists(file):
+            w = np.load(file, mmap_mode='r')
+            stats = {'method': None, 'nfev': 0, 'wall_time': 0.0, 'dense': None}
+            self.__remember__(key, (w, stats))
+            self.hits += 1
+            self.disk_hits += 1
+            return w, stats
+
+        self.misses += 1
+        return None
+
+    ## @brief Stores a result
+    #  @param key A string which is the key of the simulation
+    #  @param w An array with the results of the simulation
+    #  @param stats A dictionary of statistics of the run
+    #  @returns A read-only view of w, as it is stored
+    def put(self, key, w, stats):
+        w = w.view()
+        w.flags.writeable = False
+        self.__remember__(key, (w, stats))
+
+        file = self.__path_of__(key)
+        if file is not None and not os.path.exists(file):
+            tmp = file + '.' + str(os.getpid()) + '.tmp'
+            with open(tmp, 'wb') as f:
+                np.save(f, w)
+            os.replace(tmp, file)
+        return w
+
+    ## @brief Removes every result from memory and from disk
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
+        if self.path is not None:
+            for name in os.listdir(self.path):
+                if name.endswith('.npy'):
+                    os.remove(os.path.join(self.path, name))
+
+    ## @brief Getter for the counters of the cache
+    #  @returns A dictionary with the number of 'hits' (of which
+    #           'disk_hits' came from disk), 'misses', in-memory 'entries'
+    #           and 'bytes' held in memory
+    def get_stats(self):
+        return {'hits': self.hits, 'disk_hits': self.disk_hits,
+                'misses': self.misses, 'entries': len(self.entries),
+                'bytes': self.nbytes}
+
+    ## @brief helper method to keep a result in memory
+    #  @details Evicts the least recently used results until the budget
+    #           is met. A result larger than the whole budget isn't kept.
+    #  @param key A string which is the key of the simulation
+    #  @param entry A tuple of the array of results and the statistics
+    def __remember__(self, key, entry):
+        size = entry[0].nbytes
+        if size > self.max_bytes:
+            return
+        if key in self.entries:
+            self.nbytes -= self.entries.pop(key)[0].nbytes
+        while self.nbytes + size > self.max_bytes:
+            self.nbytes -= self.entries.popitem(last=False)[1][0].nbytes
+        self.entries[key] = entry
+        self.nbytes += size
+
+    ## @brief helper method to find the file of a result
+    #  @param key A string which is the key of the simulation
+    #  @return A string which is the path of the file, or None if there
+    #          is no on-disk tier
+    def __path_of__(self, key):
+        if self.path is None:
+            return None
+        return os.path.join(self.path, key + '.npy')
@@ -0,0 +1,127 @@
+## @file SimResult.py
+#  @author Mihail Serafimovski
+#  @brief Defines an ADT which holds the results of a simulation
+#  @date Oct. 17, 2026
+
+import numpy as np
+from scipy.interpolate import CubicHermiteSpline
+
+from Checkpoint import Checkpoint
+
+## @brief Defines a simulation result ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Holds the time steps and the x, y, v_x, v_y state at each of
+#           them in contiguous arrays, stored column by column so that
+#           each field is a contiguous view. A result unpacks like the
+#           pair (t, w) returned by earlier versions of Scene.sim.
+
+
+class SimResult:
+    ## @brief Constructor for SimResult
+    #  @param t An array-like of real numbers which are the time steps
+    #  @param w An array-like with one row x, y, v_x, v_y per time step
+    #  @param stats A dictionary of statistics of the run, which may hold
+    #         a dense output function of time under 'dense'
+    #  @throws ValueError if t and w don't have one entry per time step
+    def __init__(self, t, w, stats=None):
+        self.time = np.asarray(t, dtype=np.float64)
+        self.state = np.asarray(w, dtype=np.float64)
+        self.stats = {} if stats is None else stats
+        if not(self.time.ndim == 1 and self.state.shape == (len(self.time), 4)):
+            raise ValueError
+        if self.state.strides[0] != self.state.itemsize:
+            self.state = np.asfortranarray(self.state)
+
+    ## @brief Getter for the time steps
+    #  @returns An array of real numbers which are the time steps
+    def t(self):
+        return self.time
+
+    ## @brief Getter for the state at each time step
+    #  @returns An array with one row x, y, v_x, v_y per time step
+    def w(self):
+        return self.state
+
+    ## @brief Getter for the x-component of the position
+    #  @returns A view of the x-components at each time step
+    def x(self):
+        return self.state[:, 0]
+
+    ## @brief Getter for the y-component of the position
+    #  @returns A view of the y-components at each time step
+    def y(self):
+        return self.state[:, 1]
+
+    ## @brief Getter for the x-component of the velocity
+    #  @returns A view of the x-velocities at each time step
+    def vx(self):
+        return self.state[:, 2]
+
+    ## @brief Getter for the y-component of the velocity
+    #  @returns A view of the y-velocities at each time step
+    def vy(self):
+        return self.state[:, 3]
+
+    ## @brief Getter for the statistics of the run
+    #  @returns A dictionary of statistics of the run
+    def get_stats(self):
+        return self.stats
+
+    ## @brief Getter for the state at the end of the result
+    #  @returns A Checkpoint of the last time step and its state, from
+    #           which Scene.continue_sim can resume the simulation
+    #  @throws ValueError if the result has no time steps
+    def checkpoint(self):
+        if len(self.time) == 0:
+            raise ValueError
+        return Checkpoint(self.time[-1], self.state[-1])
+
+    ## @brief Slices the result by time
+    #  @param t_start A real number, the first time to keep
+    #  @param t_end A real number, the last time to keep
+    #  @returns A SimResult of views on the time steps within
+    #           [t_start, t_end]
+    def between(self, t_start, t_end):
+        lo = np.searchsorted(self.time, t_start, side='left')
+        hi = np.searchsorted(self.time, t_end, side='right')
+        return SimResult(self.time[lo:hi], self.state[lo:hi], self.stats)
+
+    ## @brief Interpolates the state at arbitrary times
+    #  @details Uses the dense output of the integrator when it has one.
+    #           Otherwise the positions are interpolated with cubic Hermite
+    #           splines, using the velocities as their derivatives, and the
+    #           velocities linearly.
+    #  @param t_query A real number or an array-like of real numbers which
+    #         are times within the simulated interval
+    #  @returns An array x, y, v_x, v_y for a single time, or an array with
+    #           one such row per time
+    def interpolate(self, t_query):
+        tq = np.asarray(t_query, dtype=np.float64)
+        dense = self.stats.get('dense')
+        if dense is not None:
+            return np.moveaxis(dense(tq), 0, -1)
+
+        w = np.empty(tq.shape + (4,))
+        for i in (0, 1):
+            spline = CubicHermiteSpline(self.time, self.state[:, i], self.state[:, i + 2])
+            w[..., i] = spline(tq)
+            w[..., i + 2] = np.interp(tq, self.time, self.state[:, i + 2])
+
+        return w
+
+    ## @brief Getter for the number of fields when unpacked as (t, w)
+    #  @returns The natural number 2
+    def __len__(self):
+        return 2
+
+    ## @brief Indexes the result as the pair (t, w)
+    #  @param i An integer, 0 for the time steps or 1 for the states
+    #  @returns The array of time steps or of states
+    #  @throws IndexError if i is not 0, 1, -1 or -2
+    def __getitem__(self, i):
+        return (self.time, self.state)[i]
+
+    ## @brief Iterates over the result as the pair (t, w)
+    #  @returns An iterator of the time steps and the states
+    def __iter__(self):
+        return iter((self.time, self.state))
@@ -0,0 +1,149 @@
+## @file SpatialHashT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a spatial hash ADT for collision detection
+#  @date Oct. 17, 2026
+
+import numpy as np
+
+import Ranges
+
+## @brief Defines a spatial hash ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Buckets discs, given by their centers and radii, into a
+#           uniform grid of square cells at least as wide as the largest
+#           diameter, so two discs can only overlap if their cells are the
+#           same or adjacent. The buckets are kept as the indices of the
+#           discs sorted by cell, and updates only move the discs whose
+#           cell changed.
+
+
+class SpatialHashT:
+    ## @brief The offsets of the adjacent cells which are searched for
+    #         pairs, half of the neighbours so each pair is found once
+    OFFSETS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+    ## @brief Constructor for SpatialHashT
+    #  @param x_s An array-like of real numbers which are the x-components
+    #             of the centers
+    #  @param y_s An array-like of real numbers which are the y-components
+    #             of the centers
+    #  @param r_s An array-like of real numbers which are the radii
+    #  @param cell A real number which is the width of the cells, or None
+    #         for the largest diameter
+    #  @throws ValueError if the arrays aren't the same length, if a radius
+    #          is negative, or if the cells are narrower than the largest
+    #          diameter
+    def __init__(self, x_s, y_s, r_s, cell=None):
+        self.r = np.array(r_s, dtype=np.float64)
+        n = len(self.r)
+        if not(self.r.shape == (n,) and np.all(self.r >= 0)):
+            raise ValueError
+        d_max = 2 * self.r.max() if n > 0 else 0.0
+        if cell is None:
+            cell = d_max if d_max > 0 else 1.0
+        if not(cell > 0 and cell >= d_max):
+            raise ValueError
+
+        self.cell = float(cell)
+        self.x, self.y = self.__coords__(x_s, y_s)
+        self.keys = self.__keys__(self.x, self.y)
+        self.order = np.argsort(self.keys, kind='stable')
+        self.sorted = self.keys[self.order]
+        self.moved = n
+
+    ## @brief Getter for the number of discs
+    #  @returns A natural number which is the number of discs
+    def __len__(self):
+        return len(self.r)
+
+    ## @brief Getter for the number of discs re-bucketed by the last update
+    #  @returns A natural number which is the number of discs whose cell
+    #           changed in the last update, or all of them if there
+    #           hasn't been one
+    def get_moved(self):
+        return self.moved
+
+    ## @brief Moves the discs
+    #  @details Only the discs whose cell changed are taken out of their
+    #           buckets and merged back in, into their new ones
+    #  @param x_s An array-like of real numbers which are the new
+    #             x-components of the centers
+    #  @param y_s An array-like of real numbers which are the new
+    #             y-components of the centers
+    #  @returns A natural number which is the number of discs re-bucketed
+    #  @throws ValueError if there isn't one center per disc
+    def update(self, x_s, y_s):
+        self.x, self.y = self.__coords__(x_s, y_s)
+        keys = self.__keys__(self.x, self.y)
+        changed = keys != self.keys
+        moved = np.flatnonzero(changed)
+        if len(moved) > 0:
+            stay = ~changed[self.order]
+            order = self.order[stay]
+            sorted_keys = self.sorted[stay]
+            moved = moved[np.argsort(keys[moved], kind='stable')]
+            at = np.searchsorted(sorted_keys, keys[moved], side='right')
+            self.order = np.insert(order, at, moved)
+            self.sorted = np.insert(sorted_keys, at, keys[moved])
+            self.keys = keys
+        self.moved = len(moved)
+        return self.moved
+
+    ## @brief Finds the pairs of discs in the same or adjacent cells
+    #  @returns A pair of arrays (i, j) with i < j, one entry per candidate
+    #           pair of discs which may overlap
+    def candidates(self):
+        n = len(self)
+        pos = np.arange(n)
+        run_end = np.searchsorted(self.sorted, self.sorted, side='right')
+        a, b = Ranges.expand(pos, pos + 1, run_end)
+        pairs_a = [a]
+        pairs_b = [b]
+        for dx, dy in self.OFFSETS:
+            target = self.sorted + (dx << 32) + dy
+            lo = np.searchsorted(self.sorted, target, side='left')
+            hi = np.searchsorted(self.sorted, target, side='right')
+            a, b = Ranges.expand(pos, lo, hi)
+            pairs_a.append(a)
+            pairs_b.append(b)
+
+        i = self.order[np.concatenate(pairs_a)]
+        j = self.order[np.concatenate(pairs_b)]
+        return np.minimum(i, j), np.maximum(i, j)
+
+    ## @brief Finds the pairs of overlapping discs
+    #  @returns A pair of arrays (i, j) with i < j, sorted, one entry per
+    #           pair of discs whose centers are closer than the sum of
+    #           their radii
+    def pairs(self):
+        i, j = self.candidates()
+        dx = self.x[i] - self.x[j]
+        dy = self.y[i] - self.y[j]
+        rr = self.r[i] + self.r[j]
+        hit = dx * dx + dy * dy < rr * rr
+        i = i[hit]
+        j = j[hit]
+        first = np.lexsort((j, i))
+        return i[first], j[first]
+
+    ## @brief helper method to read the centers of the discs
+    #  @param x_s The x-components of the centers
+    #  @param y_s The y-components of the centers
+    #  @return A pair of float64 arrays of the x and y components
+    #  @throws ValueError if there isn't one center per disc
+    def __coords__(self, x_s, y_s):
+        x = np.array(x_s, dtype=np.float64)
+        y = np.array(y_s, dtype=np.float64)
+        if not(x.shape == self.r.shape and y.shape == self.r.shape):
+            raise ValueError
+        return x, y
+
+    ## @brief helper method to compute the cell of each disc
+    #  @param x An array of the x-components of the centers
+    #  @param y An array of the y-components of the centers
+    #  @return An array of integers, ix * 2^32 + iy for the disc in cell
+    #          (ix, iy), which sort like the pairs (ix, iy)
+    def __keys__(self, x, y):
+        ix = np.floor(x / self.cell).astype(np.int64)
+        iy = np.floor(y / self.cell).astype(np.int64)
+        return (ix << 32) + iy
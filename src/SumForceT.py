@@ -0,0 +1,46 @@
+## @file SumForceT.py
+#  @author Mihail Serafimovski
+#  @brief Defines a sum of forces ADT
+#  @date Oct. 17, 2026
+
+from ForceT import ForceT
+
+## @brief Defines a sum of forces ADT. Assumption: Assume all inputs
+#         provided to methods are of the correct type
+#  @details Extends the ForceT interface. The force is the sum of a
+#           sequence of forces.
+
+
+class SumForceT(ForceT):
+    __slots__ = ('Fs',)
+
+    ## @brief Constructor for SumForceT
+    #  @param Fs A sequence of ForceT objects which are the terms
+    #  @throws ValueError if there are no terms
+    def __init__(self, Fs):
+        self.Fs = tuple(Fs)
+        if len(self.Fs) == 0:
+            raise ValueError
+
+    ## @brief Evaluates the force
+    #  @param t A 1-D array of real numbers which are times
+    #  @returns An array of real numbers which is the force at each time
+    def at(self, t):
+        return sum(F.at(t) for F in self.Fs)
+
+    ## @brief Getter for the antiderivative of the force
+    #  @returns A SumForceT of the antiderivatives of the terms
+    def antideriv(self):
+        return SumForceT([F.antideriv() for F in self.Fs])
+
+    ## @brief Getter for the breakpoints of the force
+    #  @returns A sorted tuple of the breakpoints of every term
+    @property
+    def breakpoints(self):
+        return tuple(sorted(set(b for F in self.Fs for b in F.breakpoints)))
+
+    ## @brief helper method to collect the state variables of the force
+    #  @return A tuple of the name of the class and the state variables of
+    #          each term
+    def __key__(self):
+        return ('SumForceT',) + tuple(F.__key__() for F in self.Fs)
@@ -0,0 +1,129 @@
+## @file Sweep.py
+#  @author Mihail Serafimovski
+#  @brief Defines the sweep module
+#  @date Oct. 17, 2026
+#  @details The sweep module simulates a scene over many initial
+#           velocities and force magnitudes on a pool of processes.
+#           The workers write their trajectories directly into a
+#           shared-memory array instead of sending them back.
+
+import itertools
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import Integrators
+from Scene import Scene
+
+## @brief The state of a worker process, set by __init_worker__
+__worker__ = {}
+
+
+## @brief Builds the parameters of a sweep over a grid
+#  @param v_xs A sequence of real numbers which are initial velocities
+#         in the x-dir
+#  @param v_ys A sequence of real numbers which are initial velocities
+#         in the y-dir
+#  @param f_scales A sequence of real numbers which scale both forces
+#  @returns A list of (v_x, v_y, f_scale) triples, one per grid point
+
+
+def grid(v_xs, v_ys, f_scales):
+    return list(itertools.product(v_xs, v_ys, f_scales))
+
+
+## @brief Simulates a scene for every parameter triple on a process pool
+#  @details The runs are handed out to the workers in chunks of
+#           consecutive parameters, and run k is always written to row k
+#           of the result, so the result doesn't depend on scheduling.
+#           Workers are forked, so the scene's forces need not be picklable.
+#  @param scene A Scene whose shape and forces are used for every run
+#  @param params A sequence of (v_x, v_y, f_scale) triples, each giving the
+#         initial velocities of a run and the factor both forces are
+#         scaled by
+#  @param t_final A real number which specifies the amount
+#         of time each simulation should run for
+#  @param nsteps A natural number which specifies how many
+#         steps of time there should be in each simulation
+#  @param workers A natural number which is the number of worker
+#         processes, or None for one per CPU
+#  @param chunk A natural number which is the number of runs handed
+#         to a worker at a time
+#  @param method A string which is the name of the integrator backend
+#  @returns An array of real numbers representing the time steps and an
+#           (len(params), nsteps, 4) array with the results of each run
+#  @throws ValueError if params is empty or the method is unknown
+
+
+def sweep(scene, params, t_final, nsteps, workers=None, chunk=1, method='odeint'):
+    Integrators.get(method)
+    n = len(params)
+    if n == 0:
+        raise ValueError
+
+    shape = (n, nsteps, 4)
+    shm = shared_memory.SharedMemory(create=True, size=8 * n * nsteps * 4)
+    try:
+        args = (scene, list(params), t_final, nsteps, method, shm.name, shape)
+        with ProcessPoolExecutor(workers or os.cpu_count(),
+                                 mp_context=mp.get_context('fork'),
+                                 initializer=__init_worker__, initargs=args) as pool:
+            list(pool.map(__run_chunk__, range(0, n, chunk), itertools.repeat(chunk)))
+        w = np.ndarray(shape, dtype=np.float64, buffer=shm.buf).copy()
+    finally:
+        shm.close()
+        shm.unlink()
+
+    return np.arange(nsteps) * t_final / (nsteps - 1), w
+
+
+## @brief helper function to set up a worker process
+#  @param scene A Scene whose shape and forces are used for every run
+#  @param params A list of (v_x, v_y, f_scale) triples
+#  @param t_final A real number which is the duration of each run
+#  @param nsteps A natural number which is the number of time steps
+#  @param method A string which is the name of the integrator backend
+#  @param name A string which is the name of the shared-memory block
+#  @param shape A tuple which is the shape of the result array
+
+
+def __init_worker__(scene, params, t_final, nsteps, method, name, shape):
+    shm = shared_memory.SharedMemory(name=name)
+    __worker__.update(scene=scene, params=params, t_final=t_final,
+                      nsteps=nsteps, method=method, shm=shm,
+                      w=np.ndarray(shape, dtype=np.float64, buffer=shm.buf))
+
+
+## @brief helper function to simulate a chunk of runs in a worker
+#  @param start A natural number which is the index of the first run
+#  @param chunk A natural number which is the number of runs
+
+
+def __run_chunk__(start, chunk):
+    s = __worker__['scene']
+    F_x, F_y = s.get_unbal_forces()
+    params = __worker__['params']
+    for k in range(start, min(start + chunk, len(params))):
+        v_x, v_y, f_scale = params[k]
+        run = Scene(s.get_shape(), __scaled__(F_x, f_scale),
+                    __scaled__(F_y, f_scale), v_x, v_y)
+        __worker__['w'][k] = run.sim(__worker__['t_final'], __worker__['nsteps'],
+                                     method=__worker__['method'])[1]
+
+
+## @brief helper function to scale a force
+#  @param F A function which inputs and outputs real numbers
+#  @param f_scale A real number which scales the force
+#  @returns A function which is F scaled by f_scale
+
+
+def __scaled__(F, f_scale):
+    def scaled(t):
+        return f_scale * F(t)
+
+    scaled.vectorized = getattr(F, 'vectorized', False)
+    scaled.breakpoints = getattr(F, 'breakpoints', ())
+    return scaled
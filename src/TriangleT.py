@@ -7,10 +7,14 @@ from Shape import Shape
 
 ## @brief Defines a triangle ADT. Assumption: Assume all inputs
 #         provided to methods are of the correct type
-#  @details Extends the Shape interface
+#  @details Extends the Shape interface.
+#           Instances have no __dict__ and take at most 64 bytes
+#           (as reported by sys.getsizeof) besides their field values.
 
 
 class TriangleT(Shape):
+    __slots__ = ('x', 'y', 's', 'm')
+
     ## @brief Constructor for TriangleT
     #  @param x A real number which is the x-component of the center of mass
     #  @param y A real number which is the y-component of the center of mass
@@ -48,8 +52,27 @@ class TriangleT(Shape):
     def m_inert(self):
         return self.m * (self.s**2) / 12
 
+    ## @brief Getter for the circumradius of the triangle
+    #  @returns A real number which is the radius of the circle through
+    #           the triangle's corners, about its center of mass
+    def radius(self):
+        return self.s / 3**0.5
+
     ## @brief Method to help with object comparison when testing
     #  @param other Another shape to test for equality
-    #  @returns A boolean, true iff both objects have the same state variables
+    #  @returns A boolean, true iff both objects are the same type of shape
+    #           with the same state variables
     def __eq__(self, other):
-        return self.__dict__ == other.__dict__
+        if type(self) is not type(other):
+            return NotImplemented
+        return self.__key__() == other.__key__()
+
+    ## @brief Method to allow the triangle to be used as a dict or set key
+    #  @returns An integer hash, consistent with __eq__
+    def __hash__(self):
+        return hash(self.__key__())
+
+    ## @brief helper method to collect the state variables of the triangle
+    #  @return A tuple of the state variables of the triangle
+    def __key__(self):
+        return (self.x, self.y, self.s, self.m)
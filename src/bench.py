@@ -0,0 +1,229 @@
+## @file bench.py
+#  @author Mihail Serafimovski
+#  @brief Benchmarks of the simulation modules
+#  @date Oct. 17, 2026
+#  @details Run with make bench, or python bench.py [name ...] to run only
+#           some of the benchmarks
+
+import math
+import sys
+import time
+from fractions import Fraction
+
+import numpy as np
+
+from BodyT import BodyT
+from CircleT import CircleT
+from KdTreeT import KdTreeT
+from MomentAccumT import MomentAccumT
+from NBodyScene import NBodyScene
+from Scene import Scene
+from SceneEnsemble import SceneEnsemble
+from SpatialHashT import SpatialHashT
+
+
+## @brief Times a function
+#  @param f A function of no arguments
+#  @param repeat A natural number which is the number of runs
+#  @returns A real number which is the fastest wall time of f, in seconds
+
+
+def timed(f, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+## @brief Fits the exponent of a power law
+#  @param ns A sequence of problem sizes
+#  @param ts A sequence of times, one per size
+#  @returns A real number k such that the times grow like n^k
+
+
+def exponent(ns, ts):
+    return np.polyfit(np.log(ns), np.log(ts), 1)[0]
+
+
+## @brief Compares Barnes-Hut accelerations against direct sums
+#  @details Prints the time of each method, the median relative error of
+#           Barnes-Hut, and the fitted scaling exponent of each method
+#  @param ns A sequence of numbers of bodies
+#  @param theta A real number which is the opening angle
+
+
+def bench_nbody(ns=(1000, 2000, 4000, 8000, 16000), theta=0.5):
+    rng = np.random.default_rng(0)
+    t_bh = []
+    t_direct = []
+    print('nbody: n, barnes-hut (s), direct (s), median rel. error')
+    for n in ns:
+        x, y = rng.normal(size=(2, n))
+        scene = NBodyScene.from_arrays(x, y, rng.uniform(1, 2, n), 0, 0, theta=theta)
+        t_bh.append(timed(scene.accel))
+        t_direct.append(timed(scene.accel_direct, repeat=1))
+        ax, ay = scene.accel()
+        dx, dy = scene.accel_direct()
+        err = np.median(np.hypot(ax - dx, ay - dy) / np.hypot(dx, dy))
+        print('%8d %12.4f %12.4f %12.2e' % (n, t_bh[-1], t_direct[-1], err))
+    print('scaling exponent: barnes-hut %.2f, direct %.2f'
+          % (exponent(ns, t_bh), exponent(ns, t_direct)))
+
+
+## @brief Times contact detection with the spatial hash
+#  @details The shapes are spread at a constant density, so the number of
+#           contacts grows linearly. Prints the time to build the hash and
+#           find the contacts, the time to update it after 1% of the
+#           shapes move and find them again, and the fitted scaling
+#           exponent of each.
+#  @param ns A sequence of numbers of shapes
+
+
+def bench_collide(ns=(10000, 20000, 40000, 80000, 160000, 320000)):
+    rng = np.random.default_rng(0)
+    t_build = []
+    t_update = []
+    print('collide: n, build + pairs (s), update 1% + pairs (s), contacts')
+    for n in ns:
+        side = np.sqrt(n) * 4
+        x, y = rng.uniform(0, side, size=(2, n))
+        r = rng.uniform(0.5, 1, n)
+        t_build.append(timed(lambda: SpatialHashT(x, y, r).pairs()))
+        grid = SpatialHashT(x, y, r)
+        moved = [x.copy(), x]
+        moved[0][::100] += 2
+
+        def step():
+            moved.reverse()
+            grid.update(moved[0], y)
+            grid.pairs()
+
+        t_update.append(timed(step))
+        print('%8d %12.4f %12.4f %10d' % (n, t_build[-1], t_update[-1], len(grid.pairs()[0])))
+    print('scaling exponent: build %.2f, update %.2f'
+          % (exponent(ns, t_build), exponent(ns, t_update)))
+
+
+## @brief Times regional mass queries with the k-d tree
+#  @details Prints the time to build the tree, the time per query for a
+#           batch of circles with the tree and by filtering every point,
+#           and the fitted scaling exponent of the query time
+#  @param ns A sequence of numbers of points
+#  @param nq A natural number which is the number of circles per batch
+
+
+def bench_kdtree(ns=(10000, 100000, 1000000), nq=1000):
+    rng = np.random.default_rng(0)
+    t_query = []
+    print('kdtree: n, build (s), query tree (us), query filter (us)')
+    for n in ns:
+        x, y = rng.normal(size=(2, n))
+        m = rng.uniform(1, 2, n)
+        t_build = timed(lambda: KdTreeT(x, y, m), repeat=1)
+        tree = KdTreeT(x, y, m)
+        cx, cy = rng.uniform(-2, 2, size=(2, nq))
+        r = rng.uniform(0, 0.5, nq)
+        t_query.append(timed(lambda: tree.circles(cx, cy, r)) / nq)
+
+        def filtered():
+            for k in range(10):
+                sel = (x - cx[k])**2 + (y - cy[k])**2 <= r[k]**2
+                np.dot(m[sel], x[sel])
+
+        t_filter = timed(filtered, repeat=1) / 10
+        print('%8d %12.4f %12.1f %12.1f' % (n, t_build, t_query[-1] * 1e6, t_filter * 1e6))
+    print('scaling exponent: query %.2f' % exponent(ns, t_query))
+
+
+## @brief Compares the robust moment accumulation against the naive one
+#  @details The points sit about 10^7 from the origin with a spread of 1.
+#           Prints the throughput of the naive and robust vectorized
+#           paths and of exact Fraction arithmetic on a sample, the
+#           relative error of each path's moment of inertia against a
+#           correctly rounded reference, and the robust path's error
+#           estimate
+#  @param ns A sequence of numbers of points
+#  @param sample A natural number which is the number of points summed
+#                with Fractions
+
+
+def bench_moments(ns=(100000, 1000000, 4000000), sample=2000):
+    rng = np.random.default_rng(0)
+    print('moments: n, naive (Mpt/s), robust (Mpt/s), fraction (Mpt/s), '
+          'naive rel. error, robust rel. error, robust estimate')
+    for n in ns:
+        x = 1e7 + rng.normal(size=n)
+        y = -1e7 + rng.normal(size=n)
+        m = rng.uniform(1, 2, n)
+        t_naive = timed(lambda: BodyT.from_arrays(x, y, m))
+        t_robust = timed(lambda: BodyT.from_arrays(x, y, m, robust=True))
+
+        def exact():
+            xs, ys, ms = ([Fraction(float(v)) for v in z[:sample]] for z in (x, y, m))
+            mass = sum(ms)
+            cx = sum(a * b for a, b in zip(xs, ms)) / mass
+            cy = sum(a * b for a, b in zip(ys, ms)) / mass
+            return sum(b * ((a - cx)**2 + (c - cy)**2) for a, c, b in zip(xs, ys, ms))
+
+        t_exact = timed(exact, repeat=1) / sample * n
+        mass = math.fsum(m)
+        cx = math.fsum(m * x) / mass
+        cy = math.fsum(m * y) / mass
+        ref = math.fsum(m * (x - cx)**2) + math.fsum(m * (y - cy)**2)
+        acc = MomentAccumT()
+        acc.add_chunk(x, y, m)
+        err_naive = abs(BodyT.from_arrays(x, y, m).m_inert() - ref) / ref
+        err_robust = abs(acc.moments()[3] - ref) / ref
+        print('%8d %10.1f %10.1f %10.3f %12.2e %12.2e %12.2e'
+              % (n, n / t_naive / 1e6, n / t_robust / 1e6, n / t_exact / 1e6,
+                 err_naive, err_robust, acc.error() / ref))
+
+
+## @brief Compares simulating an ensemble against one scene at a time
+#  @details Every scene has its own shape and a force which depends on
+#           the scene. Prints, per method, the time per scene of the
+#           ensemble with the force vectorized over the times and with it
+#           called once per time step, and of looping Scene.sim over a
+#           sample of the scenes with plain functions of time, followed by
+#           the speedup of the vectorized ensemble over the loop.
+#  @param n A natural number which is the number of scenes
+#  @param nsteps A natural number which is the number of time steps
+#  @param sample A natural number which is the number of scenes
+#                simulated one at a time
+
+
+def bench_ensemble(n=500, nsteps=1000, sample=20):
+    def F(t, i):
+        return np.cos(t) * (i + 1)
+
+    def G(t, i):
+        return np.cos(t) * (i + 1)
+
+    def one(i):
+        return lambda t: math.cos(t) * (i + 1)
+
+    F.vectorized = True
+    shapes = [CircleT(i, -i, 1, i + 1) for i in range(n)]
+    v_x = np.arange(n, dtype=np.float64)
+    per_step = SceneEnsemble(shapes, G, G, v_x, -1)
+    ensemble = SceneEnsemble(shapes, F, F, v_x, -1)
+    scenes = [Scene(shapes[i], one(i), one(i), v_x[i], -1) for i in range(sample)]
+    print('ensemble: method, vectorized (ms/scene), per step (ms/scene), '
+          'one at a time (ms/scene), speedup')
+    for method in ('odeint', 'rk4', 'verlet'):
+        t_vec = timed(lambda: ensemble.sim(10, nsteps, method=method)) / n
+        t_step = timed(lambda: per_step.sim(10, nsteps, method=method)) / n
+        t_one = timed(lambda: [sc.sim(10, nsteps, method=method) for sc in scenes]) / sample
+        print('%8s %12.4f %12.4f %12.4f %10.1f'
+              % (method, t_vec * 1e3, t_step * 1e3, t_one * 1e3, t_one / t_vec))
+
+
+## @brief The benchmarks, by name
+BENCHES = {'nbody': bench_nbody, 'collide': bench_collide, 'kdtree': bench_kdtree,
+           'moments': bench_moments, 'ensemble': bench_ensemble}
+
+if __name__ == '__main__':
+    for name in sys.argv[1:] or BENCHES:
+        BENCHES[name]()
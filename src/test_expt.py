@@ -2,6 +2,7 @@ from CircleT import CircleT
 from TriangleT import TriangleT
 from BodyT import BodyT
 from Scene import Scene
+import Force
 from Plot import plot
 
 
@@ -17,6 +18,11 @@ def Fy(t):
     return -g * m if t < 3 else g * m
 
 
+# declare where the forces jump, so the simulation integrates around them
+Fx = Force.with_breakpoints(Fx, [5])
+Fy = Force.with_breakpoints(Fy, [3])
+
+
 c = CircleT(1.0, 10.0, 0.5, 1.0)
 print(c.cm_x(), c.cm_y(), c.mass(), c.m_inert())
 